@@ -2,8 +2,10 @@
 PX4 Agent Configuration Management
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Mapping
+from types import MappingProxyType
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import json
 import os
@@ -27,6 +29,13 @@ class ModelConfig:
     top_p: float = 0.0
     top_k: int = 0
     max_tokens: Optional[int] = None
+    
+    # Replay responses for identical prompts (same messages and bound tools) from
+    # an in-memory cache - only meaningful with temperature 0
+    response_cache: bool = False
+    # Most responses kept before the oldest is evicted - prompts carry the whole chat
+    # history and mission state, so an unbounded cache grows for the life of the server
+    response_cache_size: int = 256
 
 @dataclass
 class AgentConfig:
@@ -174,20 +183,30 @@ def get_settings() -> PX4AgentSettings:
         _settings = PX4AgentSettings.load()
     return _settings
 
-def get_model_settings() -> Dict[str, Any]:
-    """Get model settings as dictionary"""
+@lru_cache(maxsize=1)
+def get_model_settings() -> Mapping[str, Any]:
+    """Get model settings as a read-only mapping"""
     settings = get_settings()
-    return settings.model.__dict__
+    return MappingProxyType(settings.model.__dict__)
 
-def get_agent_settings() -> Dict[str, Any]:
-    """Get agent settings as dictionary"""
+@lru_cache(maxsize=1)
+def get_agent_settings() -> Mapping[str, Any]:
+    """Get agent settings as a read-only mapping"""
     settings = get_settings()
-    return settings.agent.__dict__
+    return MappingProxyType(settings.agent.__dict__)
 
 def reload_settings(config_path: Optional[str] = None):
     """Reload settings from file"""
     global _settings
     _settings = PX4AgentSettings.load(config_path)
+    _clear_settings_caches()
+
+def _clear_settings_caches():
+    """Drop memoized settings views after settings change"""
+    get_model_settings.cache_clear()
+    get_agent_settings.cache_clear()
+    get_current_takeoff_settings.cache_clear()
+    get_current_action_settings.cache_clear()
 
 def update_takeoff_settings(latitude: float = None, longitude: float = None, heading: str = None, 
                            altitude: float = None, altitude_units: str = None):
@@ -196,42 +215,47 @@ def update_takeoff_settings(latitude: float = None, longitude: float = None, hea
     if _settings is None:
         _settings = PX4AgentSettings.load()
     
-    # Update provided fields with validation
-    if latitude is not None:
-        if not (-90 <= latitude <= 90):
-            raise ValueError(f"Latitude must be between -90 and 90, got {latitude}")
-        _settings.agent.takeoff_initial_latitude = latitude
+    # Fields may already be applied when a later one fails validation, so always invalidate
+    try:
+        # Update provided fields with validation
+        if latitude is not None:
+            if not (-90 <= latitude <= 90):
+                raise ValueError(f"Latitude must be between -90 and 90, got {latitude}")
+            _settings.agent.takeoff_initial_latitude = latitude
     
-    if longitude is not None:
-        if not (-180 <= longitude <= 180):
-            raise ValueError(f"Longitude must be between -180 and 180, got {longitude}")
-        _settings.agent.takeoff_initial_longitude = longitude
+        if longitude is not None:
+            if not (-180 <= longitude <= 180):
+                raise ValueError(f"Longitude must be between -180 and 180, got {longitude}")
+            _settings.agent.takeoff_initial_longitude = longitude
     
-    if heading is not None:
-        if not heading or not isinstance(heading, str):
-            raise ValueError("Heading must be a non-empty string")
-        _settings.agent.takeoff_default_heading = heading
+        if heading is not None:
+            if not heading or not isinstance(heading, str):
+                raise ValueError("Heading must be a non-empty string")
+            _settings.agent.takeoff_default_heading = heading
     
-    if altitude is not None:
-        if altitude <= 0:
-            raise ValueError(f"Altitude must be positive, got {altitude}")
-        _settings.agent.takeoff_default_altitude = altitude
+        if altitude is not None:
+            if altitude <= 0:
+                raise ValueError(f"Altitude must be positive, got {altitude}")
+            _settings.agent.takeoff_default_altitude = altitude
         
-    if altitude_units is not None:
-        if altitude_units not in ['feet', 'meters']:
-            raise ValueError(f"Altitude units must be 'feet' or 'meters', got '{altitude_units}'")
-        _settings.agent.takeoff_altitude_units = altitude_units
+        if altitude_units is not None:
+            if altitude_units not in ['feet', 'meters']:
+                raise ValueError(f"Altitude units must be 'feet' or 'meters', got '{altitude_units}'")
+            _settings.agent.takeoff_altitude_units = altitude_units
+    finally:
+        get_current_takeoff_settings.cache_clear()
 
-def get_current_takeoff_settings() -> Dict[str, Any]:
-    """Get current takeoff settings"""
+@lru_cache(maxsize=1)
+def get_current_takeoff_settings() -> Mapping[str, Any]:
+    """Get current takeoff settings (memoized, so returned as a read-only mapping)"""
     settings = get_settings()
-    return {
+    return MappingProxyType({
         "latitude": settings.agent.takeoff_initial_latitude,
         "longitude": settings.agent.takeoff_initial_longitude,
         "heading": settings.agent.takeoff_default_heading,
         "altitude": settings.agent.takeoff_default_altitude,
         "altitude_units": settings.agent.takeoff_altitude_units
-    }
+    })
 
 def update_current_action_settings(action_type: str, latitude: float = None, longitude: float = None, 
                                  altitude: float = None, altitude_units: str = None,
@@ -243,38 +267,43 @@ def update_current_action_settings(action_type: str, latitude: float = None, lon
     if _settings is None:
         _settings = load_settings()
     
-    # Validate action type
-    allowed_types = ['takeoff', 'waypoint', 'loiter', 'survey']
-    if action_type not in allowed_types:
-        raise ValueError(f"Invalid action type '{action_type}'. Allowed types: {', '.join(allowed_types)}")
+    # Fields may already be applied when a later one fails validation, so always invalidate
+    try:
+        # Validate action type
+        allowed_types = ['takeoff', 'waypoint', 'loiter', 'survey']
+        if action_type not in allowed_types:
+            raise ValueError(f"Invalid action type '{action_type}'. Allowed types: {', '.join(allowed_types)}")
     
-    # Update provided fields
-    _settings.agent.current_action_type = action_type
-    if latitude is not None:
-        _settings.agent.current_action_latitude = latitude
-    if longitude is not None:
-        _settings.agent.current_action_longitude = longitude
-    if altitude is not None:
-        _settings.agent.current_action_altitude = altitude
-    if altitude_units is not None:
-        _settings.agent.current_action_altitude_units = altitude_units
-    if radius is not None:
-        _settings.agent.current_action_radius = radius
-    if radius_units is not None:
-        _settings.agent.current_action_radius_units = radius_units
-    if heading is not None:
-        _settings.agent.current_action_heading = heading
-    if search_target is not None:
-        _settings.agent.current_action_search_target = search_target
-    if detection_behavior is not None:
-        if detection_behavior not in ['', 'tag_and_continue', 'detect_and_monitor']:
-            raise ValueError(f"Invalid detection behavior '{detection_behavior}'. Allowed values: '', 'tag_and_continue', 'detect_and_monitor'")
-        _settings.agent.current_action_detection_behavior = detection_behavior
+        # Update provided fields
+        _settings.agent.current_action_type = action_type
+        if latitude is not None:
+            _settings.agent.current_action_latitude = latitude
+        if longitude is not None:
+            _settings.agent.current_action_longitude = longitude
+        if altitude is not None:
+            _settings.agent.current_action_altitude = altitude
+        if altitude_units is not None:
+            _settings.agent.current_action_altitude_units = altitude_units
+        if radius is not None:
+            _settings.agent.current_action_radius = radius
+        if radius_units is not None:
+            _settings.agent.current_action_radius_units = radius_units
+        if heading is not None:
+            _settings.agent.current_action_heading = heading
+        if search_target is not None:
+            _settings.agent.current_action_search_target = search_target
+        if detection_behavior is not None:
+            if detection_behavior not in ['', 'tag_and_continue', 'detect_and_monitor']:
+                raise ValueError(f"Invalid detection behavior '{detection_behavior}'. Allowed values: '', 'tag_and_continue', 'detect_and_monitor'")
+            _settings.agent.current_action_detection_behavior = detection_behavior
+    finally:
+        get_current_action_settings.cache_clear()
 
-def get_current_action_settings() -> Dict[str, Any]:
-    """Get current action settings"""
+@lru_cache(maxsize=1)
+def get_current_action_settings() -> Mapping[str, Any]:
+    """Get current action settings (memoized, so returned as a read-only mapping)"""
     settings = get_settings()
-    return {
+    return MappingProxyType({
         "type": settings.agent.current_action_type,
         "latitude": settings.agent.current_action_latitude,
         "longitude": settings.agent.current_action_longitude,
@@ -285,4 +314,4 @@ def get_current_action_settings() -> Dict[str, Any]:
         "heading": settings.agent.current_action_heading,
         "search_target": settings.agent.current_action_search_target,
         "detection_behavior": settings.agent.current_action_detection_behavior
-    }
+    })
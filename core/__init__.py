@@ -3,7 +3,7 @@ PX4 Agent Core Module
 """
 
 from .mission import MissionItem, Mission
-from .manager import MissionManager
+from .manager import MissionManager, MissionTransaction
 from .validator import MissionValidator
 from .agent import PX4Agent
 
@@ -11,6 +11,7 @@ __all__ = [
     'MissionItem',
     'Mission',
     'MissionManager',
+    'MissionTransaction',
     'MissionValidator',
     'PX4Agent'
 ]
\ No newline at end of file
@@ -62,10 +62,10 @@ class PX4Agent:
             print(f"🔧 Loaded {len(self.tools)} tools for {mode} mode")
 
         # Initialize agent with new tools
-        self._initialize_agent()
+        self._initialize_agent(mode)
     
     
-    def _initialize_agent(self):
+    def _initialize_agent(self, mode: str = "mission"):
         """Initialize the LangGraph agent"""
         try:
             # Get LLM
@@ -76,8 +76,10 @@ class PX4Agent:
                 # Direct LangChain BaseChatModel (TensorRT)
                 llm = self.model_interface
             
-            # Create the LangGraph ReAct agent with a checkpointer for state management
-            checkpointer = InMemorySaver()
+            # Create the LangGraph ReAct agent with a checkpointer for state management.
+            # Command runs are one-shot on a unique thread and never resumed, so skip
+            # snapshotting graph state after every step there.
+            checkpointer = InMemorySaver() if mode != "command" else None
             
             
             # Create the agent graph - this will continue until no more tool calls
@@ -91,6 +93,24 @@ class PX4Agent:
             raise RuntimeError(f"Failed to initialize agent: {str(e)}")
     
     
+    def warmup(self) -> None:
+        """Build the mission mode pipeline and run one throwaway model call so the
+        first real request does not pay for model loading and prompt processing"""
+        # Throwaway tools so the agent's mode, tools and mission manager stay untouched
+        tools = get_tools_for_mode(MissionManager(mode="mission"), "mission")
+        
+        if hasattr(self.model_interface, 'get_llm'):
+            llm = self.model_interface.get_llm()
+        else:
+            llm = self.model_interface
+        
+        # Same system prompt and tool schemas as a real mission request, but
+        # outside the agent graph so no mission state or chat history is touched
+        llm.bind_tools(tools).invoke([
+            SystemMessage(content=get_system_prompt("mission")),
+            HumanMessage(content="Reply with OK.")
+        ])
+    
     def mission_mode(self, user_input: str) -> Dict[str, Any]:
         """Execute mission mode - interactive mission building"""
         
@@ -331,7 +351,7 @@ class PX4Agent:
         # Count different command types
         command_counts = {}
         for item in mission.items:
-            cmd_name = getattr(item, 'command_type', 'unknown').title()
+            cmd_name = item.command_type.title()
             command_counts[cmd_name] = command_counts.get(cmd_name, 0) + 1
         
         return {
@@ -5,11 +5,93 @@ Manages single current mission and validation
 
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+import threading
 
 from config import get_settings
 from core.mission import Mission, MissionItem
 from core.validator import MissionValidator
-import json
+import orjson
+
+
+def _summarize_item(item: MissionItem) -> Dict[str, str]:
+    """Build the summary fields shown for a mission item or the current action"""
+    # MissionItem is a dataclass, so every field is always present - read each once
+    command_type = item.command_type
+    altitude, altitude_units = item.altitude, item.altitude_units
+    radius, radius_units = item.radius, item.radius_units
+    latitude, longitude = item.latitude, item.longitude
+    distance, distance_units, heading = item.distance, item.distance_units, item.heading
+    ref_frame = item.relative_reference_frame
+    search_target, detection_behavior = item.search_target, item.detection_behavior
+    
+    data = {
+        "type": command_type
+    }
+    
+    # Add key parameters
+    if altitude is not None or altitude_units is not None:
+        altitude_val = altitude if altitude is not None else "(altitude)"
+        alt_units = altitude_units if altitude_units is not None else "(altitude_units)"
+        data["altitude"] = f"{altitude_val} {alt_units}"
+    
+    # Show radius if either radius or radius_units is specified
+    if radius is not None or radius_units is not None:
+        radius_val = radius if radius is not None else "(radius)"
+        radius_units = radius_units if radius_units is not None else "(radius_units)"
+        data["radius"] = f"{radius_val} {radius_units}"
+    
+    # Add position info - prioritize absolute coordinates
+    if latitude is not None and longitude is not None:
+        data["position"] = f"lat/lon ({latitude:.6f}, {longitude:.6f})"
+    elif item.mgrs is not None:
+        data["position"] = f"MGRS {item.mgrs}"
+    elif distance is not None or (heading is not None and command_type != 'takeoff') or distance_units is not None or ref_frame is not None:
+        distance = distance if distance is not None else "(distance)"
+        dist_units = distance_units if distance_units is not None else "(distance_units)"
+        heading_val = heading if heading is not None else "(heading)"
+        ref_frame = ref_frame if ref_frame is not None else "(relative_reference_frame)"
+        data["position"] = f"{distance} {dist_units} {heading_val} from {ref_frame}"
+    
+    # Always show heading for takeoff commands (VTOL transition direction)
+    if command_type == 'takeoff' and heading is not None:
+        data["heading"] = heading
+    
+    # Show search parameters if any are specified
+    if search_target is not None or detection_behavior is not None:
+        search_target = search_target if search_target is not None else "(search_target)"
+        detection_behavior = detection_behavior if detection_behavior is not None else "(detection_behavior)"
+        data["search"] = f"target={search_target}, behavior={detection_behavior}"
+    
+    return data
+
+
+class MissionTransaction:
+    """Undo-log transaction over the current mission.
+    
+    Only the inverse of each structural edit (insert/remove/clear) and a field
+    snapshot of each item edited in place is recorded, so starting and committing
+    are O(1) and rolling back costs only what was changed.
+    """
+    
+    __slots__ = ('_manager', '_mission', '_journal')
+    
+    def __init__(self, manager: 'MissionManager'):
+        self._manager = manager
+        self._mission = manager.get_mission()
+        self._journal = self._mission.begin_journal() if self._mission else None
+        # Edits under the transaction happen in place, some on paths that neither
+        # commit nor roll back, so treat anything cached before it as stale
+        manager.mark_modified()
+    
+    def commit(self):
+        """Keep all changes made since the transaction began"""
+        if self._mission:
+            self._mission.end_journal(self._journal)
+    
+    def rollback(self):
+        """Undo all recorded changes made since the transaction began"""
+        if self._mission and self._mission.undo_journal(self._journal):
+            self._manager.mark_modified()
 
 
 class MissionManager:
@@ -20,11 +102,21 @@ class MissionManager:
         self.current_action: Optional[MissionItem] = None  # For command mode
         self.mode = mode
         self.validator = MissionValidator(get_settings())
+        self.version = 0  # Bumped on every mission mutation so derived state can be cached
+        self._summary_cache: Optional[Tuple[int, str]] = None  # (mission version, rendered summary)
+        self._validation_cache: Optional[Tuple[int, str, bool, List[str]]] = None  # (mission version, mode, is_valid, messages)
+        self.lock = threading.RLock()  # Serializes tool runs - LangGraph may execute tool calls concurrently
+    
+    def mark_modified(self) -> int:
+        """Record a mission mutation and return the new mission version"""
+        self.version += 1
+        return self.version
     
     def create_mission(self) -> Mission:
         """Create a new current mission"""
         mission = Mission()
         self.current_mission = mission
+        self.mark_modified()
         return mission
     
     def get_mission(self) -> Optional[Mission]:
@@ -35,6 +127,7 @@ class MissionManager:
         """Clear current mission"""
         if self.current_mission:
             self.current_mission = None
+            self.mark_modified()
             return True
         return False
     
@@ -42,36 +135,37 @@ class MissionManager:
         """Check if current mission exists"""
         return self.current_mission is not None
     
+    def is_empty(self) -> bool:
+        """Check if there is no current mission or it has no items"""
+        return self.current_mission is None or not self.current_mission.items
+    
     def set_mode(self, mode: str):
         """Set the validation mode"""
         self.mode = mode
     
+    def begin_transaction(self) -> 'MissionTransaction':
+        """Start recording mission edits so they can be rolled back"""
+        return MissionTransaction(self)
+    
     def insert_item_at(self, item: MissionItem, position: Optional[int] = None) -> MissionItem:
         """Insert mission item at specific position or append to end"""
         mission = self._get_current_mission_or_raise()
         
         if position is None or position <= 0:
             # Append to end (default behavior)
-            item.seq = len(mission.items)
-            mission.items.append(item)
+            mission.add_item(item)
         else:
             # Insert at specific position (1-based)
             insert_index = position - 1  # Convert to 0-based index
             
             if insert_index > len(mission.items):
                 # If position is beyond current length, append to end
-                item.seq = len(mission.items)
-                mission.items.append(item)
+                mission.add_item(item)
             else:
-                # Insert at specified position
-                item.seq = insert_index
-                mission.items.insert(insert_index, item)
-                
-                # Resequence all items after insertion
-                for i, mission_item in enumerate(mission.items):
-                    mission_item.seq = i
+                # Insert at specified position (resequences following items)
+                mission.insert_item(insert_index, item)
         
-        mission.modified_at = datetime.now()
+        self.mark_modified()
         return item
     
     def add_takeoff(self, lat: float, lon: float, alt: float, 
@@ -215,9 +309,21 @@ class MissionManager:
     
     
     def validate_mission(self) -> Tuple[bool, List[str]]:
-        """Validate mission for safety and completeness"""
+        """Validate mission for safety and completeness, skipping the walk if nothing changed since a clean pass"""
         mission = self._get_current_mission_or_raise()
+        
+        # A pass that applied no fixes left the mission untouched, so re-running it on the
+        # same version and mode would give the same result
+        cached = self._validation_cache
+        if cached and cached[0] == self.version and cached[1] == self.mode:
+            return cached[2], cached[3].copy()
+        
         is_valid, errors, fixes_applied = self.validator.validate_mission(mission, self.mode)
+        if fixes_applied:
+            # Auto-fixes mutate the mission in place
+            self.mark_modified()
+        else:
+            self._validation_cache = (self.version, self.mode, is_valid, errors.copy())
         
         # Combine errors and fixes for reporting
         all_messages = errors.copy()
@@ -226,6 +332,18 @@ class MissionManager:
         
         return is_valid, all_messages
     
+    def appended_rtl_error(self) -> str:
+        """
+        Validation error that appending an RTL would cause, known without running validation.
+        
+        Only answered for a mission whose last pass at this version was clean - otherwise
+        earlier errors or auto-fixes could come first, so returns "" and leaves it to validate_mission
+        """
+        cached = self._validation_cache
+        if not (cached and cached[0] == self.version and cached[1] == self.mode and cached[2] and not cached[3]):
+            return ""
+        return self.validator.appended_rtl_error(self.current_mission, self.mode)
+    
     def _get_current_mission_or_raise(self) -> Mission:
         """Get current mission or raise error if not found"""
         if not self.current_mission:
@@ -234,7 +352,17 @@ class MissionManager:
     
     
     def get_mission_state_summary(self) -> str:
-        """Get brief summary of current mission state in JSON format"""
+        """Get brief summary of current mission state in JSON format, re-rendered only after a mutation"""
+        cached = self._summary_cache
+        if cached and cached[0] == self.version:
+            return cached[1]
+        
+        summary = self._render_mission_state_summary()
+        self._summary_cache = (self.version, summary)
+        return summary
+    
+    def _render_mission_state_summary(self) -> str:
+        """Render brief summary of current mission state in JSON format"""
         
         mission = self.get_mission()
         mission_state = {
@@ -243,66 +371,22 @@ class MissionManager:
 
         if mission and mission.items:
             # Items already have absolute coordinates after validation conversion
-            items_to_display = mission.items
-            
-            items = {}
-            for i, item in enumerate(items_to_display):
-                command_type = getattr(item, 'command_type', 'unknown')
-                
-                item_data = {
-                    "type": command_type
-                }
-                
-                # Add key parameters
-                if (hasattr(item, 'altitude') and item.altitude is not None) or (hasattr(item, 'altitude_units') and item.altitude_units is not None):
-                    altitude_val = item.altitude if item.altitude is not None else "(altitude)"
-                    alt_units = item.altitude_units if item.altitude_units is not None else "(altitude_units)"
-                    item_data["altitude"] = f"{altitude_val} {alt_units}"
-                
-                # Show radius if either radius or radius_units is specified
-                if (hasattr(item, 'radius') and item.radius is not None) or (hasattr(item, 'radius_units') and item.radius_units is not None):
-                    radius_val = item.radius if item.radius is not None else "(radius)"
-                    radius_units = item.radius_units if item.radius_units is not None else "(radius_units)"
-                    item_data["radius"] = f"{radius_val} {radius_units}"
-                
-                # Add position info - prioritize absolute coordinates from conversion
-                if (hasattr(item, 'latitude') and item.latitude is not None) and (hasattr(item, 'longitude') and item.longitude is not None):
-                    lat_val = f"{item.latitude:.6f}"
-                    lon_val = f"{item.longitude:.6f}"
-                    item_data["position"] = f"lat/lon ({lat_val}, {lon_val})"
-                elif hasattr(item, 'mgrs') and item.mgrs is not None:
-                    item_data["position"] = f"MGRS {item.mgrs}"
-                elif (hasattr(item, 'distance') and item.distance is not None) or (hasattr(item, 'heading') and item.heading is not None and item.command_type != 'takeoff') or (hasattr(item, 'distance_units') and item.distance_units is not None) or (hasattr(item, 'relative_reference_frame') and item.relative_reference_frame is not None):
-                    distance = item.distance if item.distance is not None else "(distance)"
-                    dist_units = item.distance_units if item.distance_units is not None else "(distance_units)"
-                    heading = item.heading if item.heading is not None else "(heading)"
-                    ref_frame = item.relative_reference_frame if item.relative_reference_frame is not None else "(relative_reference_frame)"
-                    item_data["position"] = f"{distance} {dist_units} {heading} from {ref_frame}"
-                
-                # Always show heading for takeoff commands (VTOL transition direction)
-                if item.command_type == 'takeoff' and hasattr(item, 'heading') and item.heading is not None:
-                    item_data["heading"] = item.heading
-                
-                # Show search parameters if any are specified (for all command types)
-                if ((hasattr(item, 'search_target') and item.search_target is not None) or (hasattr(item, 'detection_behavior') and item.detection_behavior is not None)):
-                    search_target = item.search_target if item.search_target is not None else "(search_target)"
-                    detection_behavior = item.detection_behavior if item.detection_behavior is not None else "(detection_behavior)"
-                    item_data["search"] = f"target={search_target}, behavior={detection_behavior}"
-                
-                items[f"item_{i+1}"] = item_data
-            
-            mission_state["mission_state"] = items
+            mission_state["mission_state"] = {
+                f"item_{i}": _summarize_item(item)
+                for i, item in enumerate(mission.items, 1)
+            }
         
-        return "\n\n" + json.dumps(mission_state, indent=2)
+        # orjson's 2-space indent matches json.dumps(indent=2) layout
+        return "\n\n" + orjson.dumps(mission_state, option=orjson.OPT_INDENT_2).decode()
     
     def set_current_action(self, action: MissionItem) -> None:
         """Set current action for command mode (no RTL allowed)"""
-        if getattr(action, 'command_type', None) == 'rtl':
+        if action.command_type == 'rtl':
             raise ValueError("RTL commands are not allowed as current action")
         
         # Validate command type
         allowed_types = ['takeoff', 'waypoint', 'loiter', 'survey']
-        command_type = getattr(action, 'command_type', None)
+        command_type = action.command_type
         if command_type not in allowed_types:
             raise ValueError(f"Invalid command type '{command_type}'. Allowed types: {', '.join(allowed_types)}")
         
@@ -318,53 +402,11 @@ class MissionManager:
             return "\n\n{\"current_action\": null}"
         
         action = self.current_action
-        command_type = getattr(action, 'command_type', 'unknown')
-        
-        action_data = {
-            "type": command_type
-        }
-        
-        # Add key parameters
-        if (hasattr(action, 'altitude') and action.altitude is not None) or (hasattr(action, 'altitude_units') and action.altitude_units is not None):
-            altitude_val = action.altitude if action.altitude is not None else "(altitude)"
-            alt_units = action.altitude_units if action.altitude_units is not None else "(altitude_units)"
-            action_data["altitude"] = f"{altitude_val} {alt_units}"
-        
-        # Show radius if either radius or radius_units is specified
-        if (hasattr(action, 'radius') and action.radius is not None) or (hasattr(action, 'radius_units') and action.radius_units is not None):
-            radius_val = action.radius if action.radius is not None else "(radius)"
-            radius_units = action.radius_units if action.radius_units is not None else "(radius_units)"
-            action_data["radius"] = f"{radius_val} {radius_units}"
-        
-        # Add position info
-        if (hasattr(action, 'latitude') and action.latitude is not None) and (hasattr(action, 'longitude') and action.longitude is not None):
-            lat_val = f"{action.latitude:.6f}"
-            lon_val = f"{action.longitude:.6f}"
-            action_data["position"] = f"lat/lon ({lat_val}, {lon_val})"
-        elif hasattr(action, 'mgrs') and action.mgrs is not None:
-            action_data["position"] = f"MGRS {action.mgrs}"
-        elif (hasattr(action, 'distance') and action.distance is not None) or (hasattr(action, 'heading') and action.heading is not None and action.command_type != 'takeoff') or (hasattr(action, 'distance_units') and action.distance_units is not None) or (hasattr(action, 'relative_reference_frame') and action.relative_reference_frame is not None):
-            distance = action.distance if action.distance is not None else "(distance)"
-            dist_units = action.distance_units if action.distance_units is not None else "(distance_units)"
-            heading = action.heading if action.heading is not None else "(heading)"
-            ref_frame = action.relative_reference_frame if action.relative_reference_frame is not None else "(relative_reference_frame)"
-            action_data["position"] = f"{distance} {dist_units} {heading} from {ref_frame}"
-        
-        # Always show heading for takeoff commands (VTOL transition direction)
-        if action.command_type == 'takeoff' and hasattr(action, 'heading') and action.heading is not None:
-            action_data["heading"] = action.heading
-        
-        # Show search parameters if any are specified
-        if ((hasattr(action, 'search_target') and action.search_target is not None) or (hasattr(action, 'detection_behavior') and action.detection_behavior is not None)):
-            search_target = action.search_target if action.search_target is not None else "(search_target)"
-            detection_behavior = action.detection_behavior if action.detection_behavior is not None else "(detection_behavior)"
-            action_data["search"] = f"target={search_target}, behavior={detection_behavior}"
-        
         current_action_state = {
-            "current_action": action_data
+            "current_action": _summarize_item(action)
         }
         
-        return "\n\n" + json.dumps(current_action_state, indent=2)
+        return "\n\n" + orjson.dumps(current_action_state, option=orjson.OPT_INDENT_2).decode()
     
     def initialize_current_action_from_settings(self) -> None:
         """Initialize current action from configuration settings"""
@@ -3,7 +3,7 @@ PX4 Mission State Management
 Handles mission creation, validation, and state tracking
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
@@ -69,18 +69,112 @@ class Mission:
     created_at: datetime = field(default_factory=datetime.now)
     modified_at: datetime = field(default_factory=datetime.now)
     
+    # Undo log of structural and in-place item edits - only recorded while a transaction is open
+    _journal: Optional[List[Tuple]] = field(default=None, init=False, repr=False, compare=False)
+    
     def add_item(self, item: MissionItem) -> MissionItem:
         """Add mission item to end of mission"""
         item.seq = len(self.items)
         self.items.append(item)
+        self._record(('remove', item.seq))
+        self.modified_at = datetime.now()
+        return item
+    
+    def insert_item(self, index: int, item: MissionItem) -> MissionItem:
+        """Insert mission item at 0-based index and resequence following items"""
+        self.items.insert(index, item)
+        self._record(('remove', index))
+        self._resequence_from(index)
+        self.modified_at = datetime.now()
+        return item
+    
+    def remove_item(self, index: int) -> MissionItem:
+        """Remove mission item at 0-based index and resequence following items"""
+        item = self.items.pop(index)
+        self._record(('insert', index, item))
+        self._resequence_from(index)
         self.modified_at = datetime.now()
         return item
     
     def clear_items(self):
         """Remove all mission items"""
+        self._record(('restore', self.items[:]))
         self.items.clear()
         self.modified_at = datetime.now()
     
+    def record_item_state(self, item: MissionItem):
+        """Snapshot an item's fields before editing it in place so a rollback can restore them"""
+        self._record(('fields', item, dict(item.__dict__)))
+    
+    def begin_journal(self) -> List[Tuple]:
+        """Start recording structural edits (replaces any abandoned journal)"""
+        self._journal = []
+        return self._journal
+    
+    def end_journal(self, journal: List[Tuple]):
+        """Stop recording edits for the given journal, keeping them"""
+        if self._journal is journal:
+            self._journal = None
+    
+    def undo_journal(self, journal: List[Tuple]) -> bool:
+        """Undo all edits recorded in the given journal - returns True if anything changed"""
+        if self._journal is not journal:
+            return False
+        self._journal = None
+        
+        # Apply inverse operations newest first so recorded indices stay valid
+        start = len(self.items)
+        for entry in reversed(journal):
+            if entry[0] == 'remove':
+                del self.items[entry[1]]
+                start = min(start, entry[1])
+            elif entry[0] == 'insert':
+                self.items.insert(entry[1], entry[2])
+                start = min(start, entry[1])
+            elif entry[0] == 'fields':
+                entry[1].__dict__.update(entry[2])
+            else:
+                self.items[:] = entry[1]
+                start = 0
+        
+        self._resequence_from(start)
+        return bool(journal)
+    
+    def _record(self, entry: Tuple):
+        """Append inverse operation to the open journal, if any"""
+        if self._journal is not None:
+            self._journal.append(entry)
+    
+    def _resequence_from(self, index: int):
+        """Update sequence numbers from index onward"""
+        for i in range(index, len(self.items)):
+            self.items[i].seq = i
+    
+    def iter_item_dicts(self, convert_to_absolute: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield item dicts one at a time without building the whole mission dict
+        
+        Args:
+            convert_to_absolute: If True, convert relative coordinates to absolute for display
+        """
+        items = list(self.items)
+        
+        if convert_to_absolute and items:
+            from core.units import iter_absolute_item_dicts
+            from config.settings import get_current_takeoff_settings
+            
+            try:
+                takeoff_settings = get_current_takeoff_settings()
+            except Exception:
+                # Without an origin nothing can be converted - fall back to raw items
+                takeoff_settings = None
+            
+            if takeoff_settings:
+                yield from iter_absolute_item_dicts(items, takeoff_settings)
+                return
+        
+        for item in items:
+            yield item.to_dict()
+    
     def to_dict(self, convert_to_absolute: bool = False) -> Dict[str, Any]:
         """Convert to dictionary format
         
@@ -4,6 +4,8 @@ Handles parsing of measurements with embedded units from LLM outputs
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import Union, Tuple, Optional
 
 
@@ -17,6 +19,25 @@ UNIT_PATTERNS = {
     r'(nautical_?miles?|nm|nmi)$': 'nautical_miles',
 }
 
+# Compiled once at import - checked in the same order as UNIT_PATTERNS
+_UNIT_REGEXES = tuple((re.compile(pattern), sys.intern(units)) for pattern, units in UNIT_PATTERNS.items())
+
+# Number (int or float) + optional whitespace + optional units
+_MEASUREMENT_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*(.*)$')
+
+# Coordinate labels and formats
+_LAT_LABEL_RE = re.compile(r'lat(itude)?:\s*', re.IGNORECASE)
+_LON_LABEL_RE = re.compile(r'lon(gitude)?:\s*', re.IGNORECASE)
+_COORD_PAIR_RE = re.compile(r'^(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)$')
+_COORD_SINGLE_RE = re.compile(r'^(-?\d+(?:\.\d+)?)$')
+
+def _normalize_units(unit_text: str) -> Optional[str]:
+    """Normalize lowercase unit text (None if unrecognized)"""
+    for regex, units in _UNIT_REGEXES:
+        if regex.search(unit_text):
+            return units
+    return None
+
 
 def parse_measurement(value: Union[str, int, float, None], default_units: str = 'meters') -> Tuple[Optional[float], Optional[str]]:
     """
@@ -47,40 +68,45 @@ def parse_measurement(value: Union[str, int, float, None], default_units: str =
     
     # Handle string inputs
     if isinstance(value, str):
-        value = value.strip()
-        if not value:
-            return (None, None)
-        
-        # Try to extract number and optional units
-        # Regex matches: number (int or float) + optional whitespace + optional units
-        match = re.match(r'^(\d+(?:\.\d+)?)\s*(.*)$', value)
-        if not match:
-            return (None, None)
-        
-        try:
-            number = float(match.group(1))
-            unit_text = match.group(2).lower().strip()
-            
-            # If no unit text, use default
-            if not unit_text:
-                return (number, default_units)
-            
-            # Normalize units using patterns
-            for pattern, normalized_unit in UNIT_PATTERNS.items():
-                if re.search(pattern, unit_text):
-                    return (number, normalized_unit)
-            
-            # If we found unit text but no pattern matched, still return the number with default units
-            # This handles cases like "150 xyz" where xyz isn't a recognized unit
-            return (number, default_units)
-            
-        except (ValueError, AttributeError):
-            return (None, None)
+        return _parse_measurement_text(value, default_units)
     
     # For any other type, return None
     return (None, None)
 
 
+@lru_cache(maxsize=512)
+def _parse_measurement_text(value: str, default_units: str) -> Tuple[Optional[float], Optional[str]]:
+    """Parse measurement string - cached since the LLM repeats strings like "500 feet" across turns"""
+    value = value.strip()
+    if not value:
+        return (None, None)
+    
+    # Try to extract number and optional units
+    match = _MEASUREMENT_RE.match(value)
+    if not match:
+        return (None, None)
+    
+    try:
+        number = float(match.group(1))
+        unit_text = match.group(2).lower().strip()
+        
+        # If no unit text, use default
+        if not unit_text:
+            return (number, default_units)
+        
+        # Normalize units using patterns
+        normalized_unit = _normalize_units(unit_text)
+        if normalized_unit is not None:
+            return (number, normalized_unit)
+        
+        # If we found unit text but no pattern matched, still return the number with default units
+        # This handles cases like "150 xyz" where xyz isn't a recognized unit
+        return (number, default_units)
+        
+    except (ValueError, AttributeError):
+        return (None, None)
+
+
 def parse_altitude(value: Union[str, int, float, None]) -> Tuple[Optional[float], Optional[str]]:
     """Parse altitude measurement (defaults to meters)"""
     return parse_measurement(value, default_units='meters')
@@ -110,6 +136,19 @@ def create_measurement_validator(default_units: str = 'meters'):
     return validator
 
 
+def create_coordinates_validator():
+    """Create a Pydantic validator function for 'lat,lon' coordinate fields"""
+    def validator(v):
+        if v is None:
+            return None
+        lat, lon = parse_coordinates(v)
+        if lat is None or lon is None:
+            # Return original value to let Pydantic handle the validation error
+            return v
+        return (lat, lon)
+    return validator
+
+
 def parse_coordinates(value: Union[str, tuple, None]) -> Tuple[Optional[float], Optional[float]]:
     """
     Parse coordinate string into (latitude, longitude) tuple.
@@ -145,34 +184,41 @@ def parse_coordinates(value: Union[str, tuple, None]) -> Tuple[Optional[float],
     
     # Handle string inputs
     if isinstance(value, str):
-        value = value.strip()
-        if not value:
-            return (None, None)
-        
-        # Remove common labels/prefixes
-        value = re.sub(r'lat(itude)?:\s*', '', value, flags=re.IGNORECASE)
-        value = re.sub(r'lon(gitude)?:\s*', '', value, flags=re.IGNORECASE)
-        value = value.strip()
-        
-        # Try to extract two decimal numbers separated by comma
-        # Regex matches: float, optional whitespace, comma, optional whitespace, float
-        match = re.match(r'^(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)$', value)
-        if match:
-            try:
-                lat = float(match.group(1))
-                lon = float(match.group(2))
-                return (lat, lon)
-            except ValueError:
-                return (None, None)
-        
-        # Try single number (incomplete coordinate)
-        match = re.match(r'^(-?\d+(?:\.\d+)?)$', value)
-        if match:
-            try:
-                lat = float(match.group(1))
-                return (lat, None)
-            except ValueError:
-                return (None, None)
+        return _parse_coordinate_text(value)
     
     # For any other type, return None
+    return (None, None)
+
+
+@lru_cache(maxsize=512)
+def _parse_coordinate_text(value: str) -> Tuple[Optional[float], Optional[float]]:
+    """Parse coordinate string - cached since the same coordinates recur across turns"""
+    value = value.strip()
+    if not value:
+        return (None, None)
+    
+    # Remove common labels/prefixes
+    value = _LAT_LABEL_RE.sub('', value)
+    value = _LON_LABEL_RE.sub('', value)
+    value = value.strip()
+    
+    # Try to extract two decimal numbers separated by comma
+    match = _COORD_PAIR_RE.match(value)
+    if match:
+        try:
+            lat = float(match.group(1))
+            lon = float(match.group(2))
+            return (lat, lon)
+        except ValueError:
+            return (None, None)
+    
+    # Try single number (incomplete coordinate)
+    match = _COORD_SINGLE_RE.match(value)
+    if match:
+        try:
+            lat = float(match.group(1))
+            return (lat, None)
+        except ValueError:
+            return (None, None)
+    
     return (None, None)
\ No newline at end of file
@@ -7,7 +7,7 @@ Main function: convert_units(value, from_unit, to_unit)
   - Examples: convert_units(100, 'ft', 'm'), convert_units(1, 'km', 'miles')
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 
 
 # Conversion factors to meters (base unit)
@@ -175,8 +175,61 @@ def get_supported_units() -> list:
 # Coordinate conversion utilities
 
 import math
+from enum import IntEnum
 
-def calculate_absolute_coordinates(ref_lat: float, ref_lon: float, distance: float, heading: str, distance_units: str = 'meters') -> tuple[float, float]:
+
+class Heading(IntEnum):
+    """Compass headings - each value is the bearing in degrees"""
+    NORTH = 0
+    NORTHEAST = 45
+    EAST = 90
+    SOUTHEAST = 135
+    SOUTH = 180
+    SOUTHWEST = 225
+    WEST = 270
+    NORTHWEST = 315
+
+
+# Earth radius in meters (WGS-84 equatorial)
+EARTH_RADIUS_METERS = 6378137.0
+
+# Bearing degrees -> (sin, cos) for the compass headings
+_BEARING_TRIG = {
+    heading.value: (math.sin(math.radians(heading.value)), math.cos(math.radians(heading.value)))
+    for heading in Heading
+}
+
+
+# Lowercase heading text -> Heading, built once instead of on every coordinate calculation
+HEADING_ALIASES: Dict[str, Heading] = {
+    **{heading.name.lower(): heading for heading in Heading},
+    'n': Heading.NORTH,
+    'ne': Heading.NORTHEAST,
+    'e': Heading.EAST,
+    'se': Heading.SOUTHEAST,
+    's': Heading.SOUTH,
+    'sw': Heading.SOUTHWEST,
+    'w': Heading.WEST,
+    'nw': Heading.NORTHWEST,
+}
+
+
+def heading_to_bearing(heading: Union[str, int]) -> int:
+    """
+    Convert a compass heading to a bearing in degrees
+    
+    Args:
+        heading: Compass direction ('north', 'ne', etc.) or a bearing/Heading already
+        
+    Returns:
+        Bearing in degrees (unrecognized directions default to north)
+    """
+    if isinstance(heading, int):
+        return int(heading)
+    return HEADING_ALIASES.get(heading.lower(), Heading.NORTH).value
+
+
+def calculate_absolute_coordinates(ref_lat: float, ref_lon: float, distance: float, heading: Union[str, int], distance_units: str = 'meters') -> tuple[float, float]:
     """
     Calculate absolute lat/long coordinates from a reference point using distance and compass heading
     
@@ -184,7 +237,7 @@ def calculate_absolute_coordinates(ref_lat: float, ref_lon: float, distance: flo
         ref_lat: Reference latitude in decimal degrees
         ref_lon: Reference longitude in decimal degrees
         distance: Distance from reference point
-        heading: Compass direction ('north', 'northeast', 'east', etc.)
+        heading: Compass direction ('north', 'northeast', 'east', etc.) or bearing in degrees
         distance_units: Units of distance (converted to meters internally)
         
     Returns:
@@ -197,37 +250,44 @@ def calculate_absolute_coordinates(ref_lat: float, ref_lon: float, distance: flo
     distance_meters = convert_to_meters(distance, distance_units)
     
     # Convert heading to bearing in degrees
-    heading_map = {
-        'north': 0,
-        'northeast': 45,
-        'east': 90,
-        'southeast': 135,
-        'south': 180,
-        'southwest': 225,
-        'west': 270,
-        'northwest': 315
-    }
+    bearing_degrees = heading_to_bearing(heading)
     
-    bearing_degrees = heading_map.get(heading.lower(), 0)
-    bearing_radians = math.radians(bearing_degrees)
+    return offset_lat_lon(ref_lat, ref_lon, bearing_degrees, distance_meters)
+
+
+def offset_lat_lon(ref_lat: float, ref_lon: float, bearing_degrees: float, distance_meters: float) -> tuple[float, float]:
+    """
+    Great-circle destination point from a reference point, bearing and distance
     
-    # Earth radius in meters
-    earth_radius = 6378137.0
+    Each trig term is computed once; compass bearings reuse precomputed sin/cos.
+    
+    Returns:
+        Tuple of (lat, lon) in decimal degrees
+    """
+    bearing_trig = _BEARING_TRIG.get(bearing_degrees)
+    if bearing_trig is None:
+        bearing_radians = math.radians(bearing_degrees)
+        bearing_trig = (math.sin(bearing_radians), math.cos(bearing_radians))
+    sin_bearing, cos_bearing = bearing_trig
     
     # Convert reference coordinates to radians
     ref_lat_rad = math.radians(ref_lat)
     ref_lon_rad = math.radians(ref_lon)
+    sin_ref_lat = math.sin(ref_lat_rad)
+    cos_ref_lat = math.cos(ref_lat_rad)
+    
+    # Angular distance travelled
+    angular_distance = distance_meters / EARTH_RADIUS_METERS
+    sin_angular = math.sin(angular_distance)
+    cos_angular = math.cos(angular_distance)
     
     # Calculate new latitude
-    new_lat_rad = math.asin(
-        math.sin(ref_lat_rad) * math.cos(distance_meters / earth_radius) +
-        math.cos(ref_lat_rad) * math.sin(distance_meters / earth_radius) * math.cos(bearing_radians)
-    )
+    new_lat_rad = math.asin(sin_ref_lat * cos_angular + cos_ref_lat * sin_angular * cos_bearing)
     
     # Calculate new longitude
     new_lon_rad = ref_lon_rad + math.atan2(
-        math.sin(bearing_radians) * math.sin(distance_meters / earth_radius) * math.cos(ref_lat_rad),
-        math.cos(distance_meters / earth_radius) - math.sin(ref_lat_rad) * math.sin(new_lat_rad)
+        sin_bearing * sin_angular * cos_ref_lat,
+        cos_angular - sin_ref_lat * math.sin(new_lat_rad)
     )
     
     # Convert back to degrees
@@ -252,18 +312,37 @@ def convert_mission_to_absolute_coordinates(mission, takeoff_settings):
     if not mission or not mission.items:
         return None
     
-    # Create a deep copy for conversion (don't modify original)
-    mission_dict = mission.to_dict()
+    return {
+        'items': list(iter_absolute_item_dicts(mission.items, takeoff_settings)),
+        'created_at': mission.created_at.isoformat(),
+        'modified_at': mission.modified_at.isoformat()
+    }
+
+
+def iter_absolute_item_dicts(items, takeoff_settings):
+    """
+    Yield item dicts one at a time with relative positioning resolved to absolute coordinates.
+    Items are not modified - each yielded dict is a fresh copy.
     
+    Args:
+        items: Sequence of MissionItem objects in mission order
+        takeoff_settings: Dict with origin coordinates {'latitude': float, 'longitude': float}
+        
+    Yields:
+        Item dicts with absolute coordinates where they could be computed
+    """
     origin_lat = takeoff_settings['latitude']
     origin_lon = takeoff_settings['longitude']
     last_lat, last_lon = origin_lat, origin_lon
     
-    for item_dict in mission_dict['items']:
+    for item in items:
+        item_dict = item.to_dict()
+        
         # Skip items that already have absolute coordinates and no relative positioning
         if (item_dict.get('latitude') is not None and item_dict.get('longitude') is not None and
             item_dict.get('distance') is None and item_dict.get('heading') is None):
             last_lat, last_lon = item_dict['latitude'], item_dict['longitude']
+            yield item_dict
             continue
         
         # Handle items with relative positioning
@@ -271,45 +350,49 @@ def convert_mission_to_absolute_coordinates(mission, takeoff_settings):
             # Determine reference point based on reference frame
             ref_frame = item_dict.get('relative_reference_frame', 'origin')
             
-            if ref_frame == 'self':
-                # For 'self' reference, calculate offset from item's current position
-                if item_dict.get('latitude') is not None and item_dict.get('longitude') is not None:
-                    ref_lat, ref_lon = item_dict['latitude'], item_dict['longitude']
-                    # Calculate new position from current position + offset
+            try:
+                if ref_frame == 'self':
+                    # For 'self' reference, calculate offset from item's current position
+                    if item_dict.get('latitude') is not None and item_dict.get('longitude') is not None:
+                        ref_lat, ref_lon = item_dict['latitude'], item_dict['longitude']
+                        # Calculate new position from current position + offset
+                        new_lat, new_lon = calculate_absolute_coordinates(
+                            ref_lat, ref_lon,
+                            item_dict['distance'], item_dict['heading'],
+                            item_dict.get('distance_units', 'meters')
+                        )
+                        # Update the displayed coordinates
+                        item_dict['latitude'] = new_lat
+                        item_dict['longitude'] = new_lon
+                        last_lat, last_lon = new_lat, new_lon
+                    # If no existing coordinates for 'self', leave as-is (validation should catch this)
+                
+                else:
+                    if ref_frame == 'origin':
+                        ref_lat, ref_lon = origin_lat, origin_lon
+                    else:  # 'last_waypoint' or default
+                        ref_lat, ref_lon = last_lat, last_lon
+                    
                     new_lat, new_lon = calculate_absolute_coordinates(
                         ref_lat, ref_lon,
                         item_dict['distance'], item_dict['heading'],
                         item_dict.get('distance_units', 'meters')
                     )
+                    
                     # Update the displayed coordinates
                     item_dict['latitude'] = new_lat
                     item_dict['longitude'] = new_lon
                     last_lat, last_lon = new_lat, new_lon
-                # If no existing coordinates for 'self', leave as-is (validation should catch this)
-            
-            elif ref_frame == 'origin':
-                ref_lat, ref_lon = origin_lat, origin_lon
-            else:  # 'last_waypoint' or default
-                ref_lat, ref_lon = last_lat, last_lon
             
-            # For non-'self' reference frames, calculate absolute coordinates
-            if ref_frame != 'self':
-                new_lat, new_lon = calculate_absolute_coordinates(
-                    ref_lat, ref_lon,
-                    item_dict['distance'], item_dict['heading'],
-                    item_dict.get('distance_units', 'meters')
-                )
-                
-                # Update the displayed coordinates
-                item_dict['latitude'] = new_lat
-                item_dict['longitude'] = new_lon
-                last_lat, last_lon = new_lat, new_lon
+            except Exception:
+                # If conversion fails, leave item as is
+                pass
         
         # Update last known position for next iteration
         elif item_dict.get('latitude') is not None and item_dict.get('longitude') is not None:
             last_lat, last_lon = item_dict['latitude'], item_dict['longitude']
-    
-    return mission_dict
+        
+        yield item_dict
 
 
 # Easy extensibility: To add new units, just add to UNIT_CONVERSIONS
@@ -3,6 +3,7 @@ PX4 Mission Validation
 Handles mission validation logic and safety checks
 """
 
+from collections import Counter
 from typing import List, Tuple, Optional
 from config.settings import PX4AgentSettings
 from core.mission import Mission, MissionItem
@@ -63,10 +64,10 @@ class MissionValidator:
         # Check navigation commands for altitude limits
         nav_command_types = ['waypoint', 'takeoff', 'loiter', 'rtl']
         
-        command_type = getattr(item, 'command_type', None)
+        command_type = item.command_type
         if command_type in nav_command_types:
             # Check altitude from the field where it's actually stored
-            altitude_value = getattr(item, 'altitude', None)
+            altitude_value = item.altitude
             if altitude_value is not None and altitude_value <= 0:
                 errors.append(f"Item {index}: Altitude must be positive")
         
@@ -80,12 +81,10 @@ class MissionValidator:
         """Validate that positioning data is consistent based on reference frame rules"""
         errors = []
         
-        has_absolute = (hasattr(item, 'latitude') and item.latitude is not None and 
-                       hasattr(item, 'longitude') and item.longitude is not None)
-        has_relative = (hasattr(item, 'distance') and item.distance is not None and 
-                       hasattr(item, 'heading') and item.heading is not None)
-        has_mgrs = (hasattr(item, 'mgrs') and item.mgrs is not None)
-        ref_frame = getattr(item, 'relative_reference_frame', None)
+        has_absolute = (item.latitude is not None and item.longitude is not None)
+        has_relative = (item.distance is not None and item.heading is not None)
+        has_mgrs = item.mgrs is not None
+        ref_frame = item.relative_reference_frame
         
         # Rule 1: Only 'self' reference frame can have both absolute and relative positioning
         if has_absolute and has_relative:
@@ -112,12 +111,14 @@ class MissionValidator:
         errors = []
         fixes = []
         
-        has_takeoff = any(getattr(item, 'command_type', None) == 'takeoff' for item in mission.items)
-        has_rtl = any(getattr(item, 'command_type', None) == 'rtl' for item in mission.items)
+        # Tally command types in one pass instead of scanning once per type
+        type_counts = self._count_command_types(mission)
+        has_takeoff = type_counts['takeoff'] > 0
+        has_rtl = type_counts['rtl'] > 0
         
         # Check takeoff positioning - auto-fix or error
         if self.settings.agent.takeoff_must_be_first and has_takeoff:
-            if getattr(mission.items[0], 'command_type', None) != 'takeoff':
+            if mission.items[0].command_type != 'takeoff':
                 if self.settings.agent.auto_fix_positioning:
                     self._move_takeoff_to_start(mission)
                     fixes.append("Moved takeoff command to the beginning of mission")
@@ -126,7 +127,7 @@ class MissionValidator:
 
         # Check RTL positioning - auto-fix or error
         if self.settings.agent.rtl_must_be_last and has_rtl:
-            if getattr(mission.items[-1], 'command_type', None) != 'rtl':
+            if mission.items[-1].command_type != 'rtl':
                 if self.settings.agent.auto_fix_positioning:
                     self._move_rtl_to_end(mission)
                     fixes.append("Moved RTL command to the end of mission")
@@ -145,24 +146,51 @@ class MissionValidator:
         # Parameter completion is now handled at the main validation level
         
         # Check for multiple takeoffs/RTLs (after auto-addition)
-        takeoff_count = sum(1 for item in mission.items if getattr(item, 'command_type', None) == 'takeoff')
-        rtl_count = sum(1 for item in mission.items if getattr(item, 'command_type', None) == 'rtl')
+        type_counts = self._count_command_types(mission)
+        takeoff_count = type_counts['takeoff']
+        rtl_count = type_counts['rtl']
         
         if self.settings.agent.single_takeoff_only and takeoff_count > 1:
             errors.append(f"Mission has {takeoff_count} takeoff commands - only one is allowed")
         
         if self.settings.agent.single_rtl_only and rtl_count > 1:
-            errors.append(f"Mission has {rtl_count} RTL commands - only one is allowed")
+            errors.append(self._rtl_count_error(rtl_count))
         
         return errors, fixes
     
+    def appended_rtl_error(self, mission: Mission, mode: str) -> str:
+        """
+        First error validate_mission would report once another RTL is appended to a mission
+        that currently validates cleanly (no errors, no fixes) - empty string if there is none
+        """
+        if mode != "mission" or not self.settings.agent.single_rtl_only:
+            return ""
+        
+        # Max-items is reported ahead of the mode rules
+        if len(mission.items) + 1 > self.settings.agent.max_mission_items:
+            return ""
+        
+        # Appending keeps takeoff first and puts an RTL last, so the RTL count is the first rule to fail
+        rtl_count = self._count_command_types(mission)['rtl']
+        if rtl_count == 0:
+            return ""
+        return self._rtl_count_error(rtl_count + 1)
+    
+    def _rtl_count_error(self, rtl_count: int) -> str:
+        """Error for a mission with more than one RTL"""
+        return f"Mission has {rtl_count} RTL commands - only one is allowed"
+    
+    def _count_command_types(self, mission: Mission) -> Counter:
+        """Count mission items per command type"""
+        return Counter(item.command_type for item in mission.items)
+    
     def _move_takeoff_to_start(self, mission: Mission):
         """Move takeoff items to the beginning of mission"""
         takeoff_items = []
         other_items = []
         
         for item in mission.items:
-            if getattr(item, 'command_type', None) == 'takeoff':
+            if item.command_type == 'takeoff':
                 takeoff_items.append(item)
             else:
                 other_items.append(item)
@@ -180,7 +208,7 @@ class MissionValidator:
         other_items = []
         
         for item in mission.items:
-            if getattr(item, 'command_type', None) == 'rtl':
+            if item.command_type == 'rtl':
                 rtl_items.append(item)
             else:
                 other_items.append(item)
@@ -195,7 +223,7 @@ class MissionValidator:
     def _ensure_takeoff_exists(self, mission: Mission) -> List[str]:
         """Add takeoff command if missing"""
         fixes = []
-        has_takeoff = any(getattr(item, 'command_type', None) == 'takeoff' for item in mission.items)
+        has_takeoff = any(item.command_type == 'takeoff' for item in mission.items)
         
         if not has_takeoff:
             takeoff = MissionItem(
@@ -207,8 +235,7 @@ class MissionValidator:
                 longitude=self.settings.agent.takeoff_initial_longitude,
                 heading=self.settings.agent.takeoff_default_heading
             )
-            mission.items.insert(0, takeoff)
-            self._resequence_items(mission)
+            mission.insert_item(0, takeoff)
             fixes.append(f"Auto-added takeoff: {takeoff.altitude} {takeoff.altitude_units}")
         
         return fixes
@@ -216,7 +243,7 @@ class MissionValidator:
     def _ensure_rtl_exists(self, mission: Mission) -> List[str]:
         """Add RTL command if missing"""
         fixes = []
-        has_rtl = any(getattr(item, 'command_type', None) == 'rtl' for item in mission.items)
+        has_rtl = any(item.command_type == 'rtl' for item in mission.items)
         
         if not has_rtl:
             # Use takeoff altitude if configured and available
@@ -230,7 +257,7 @@ class MissionValidator:
                 altitude=rtl_altitude,
                 altitude_units=self.settings.agent.rtl_altitude_units
             )
-            mission.items.append(rtl)
+            mission.add_item(rtl)
             fixes.append(f"Auto-added RTL: {rtl.altitude} {rtl.altitude_units}")
         
         return fixes
@@ -240,27 +267,26 @@ class MissionValidator:
         fixes = []
         
         for i, item in enumerate(mission.items):
-            command_type = getattr(item, 'command_type', None)
+            command_type = item.command_type
             if not command_type:
                 continue
             
             # Complete altitude_units FIRST (needed for unit conversion)
-            if hasattr(item, 'altitude_units') and item.altitude_units is None:
+            if item.altitude_units is None:
                 item.altitude_units = getattr(self.settings.agent, f"{command_type}_altitude_units")
                 fixes.append(f"Set altitude units: {item.altitude_units}")
             
             # Complete altitude for all navigation commands (after units are set)
-            if hasattr(item, 'altitude'):
-                altitude_fixes = self._complete_altitude(item, command_type, mission, i)
-                fixes.extend(altitude_fixes)
+            altitude_fixes = self._complete_altitude(item, command_type, mission, i)
+            fixes.extend(altitude_fixes)
             
             # Complete radius_units FIRST for loiter/survey (needed for unit conversion)
-            if command_type in ['loiter', 'survey'] and hasattr(item, 'radius_units') and item.radius_units is None:
+            if command_type in ['loiter', 'survey'] and item.radius_units is None:
                 item.radius_units = getattr(self.settings.agent, f"{command_type}_radius_units")
                 fixes.append(f"Set radius units: {item.radius_units}")
             
             # Complete radius for loiter/survey (after units are set)
-            if command_type in ['loiter', 'survey'] and hasattr(item, 'radius'):
+            if command_type in ['loiter', 'survey']:
                 radius_fixes = self._complete_radius(item, command_type)
                 fixes.extend(radius_fixes)
             
@@ -271,20 +297,20 @@ class MissionValidator:
             
             # Complete heading for takeoff commands (always required, cannot be unset)
             if command_type == 'takeoff':
-                if not hasattr(item, 'heading') or item.heading is None:
+                if item.heading is None:
                     item.heading = self.settings.agent.takeoff_default_heading
                     fixes.append(f"Set takeoff heading: {item.heading}")
             
             # Complete distance_units for relative positioning
-            if hasattr(item, 'distance_units') and item.distance_units is None and hasattr(item, 'distance') and item.distance is not None:
+            if item.distance_units is None and item.distance is not None:
                 item.distance_units = self.settings.agent.default_distance_units
                 fixes.append(f"Set distance units: {item.distance_units}")
             
             # Complete search parameters if not specified
-            if hasattr(item, 'search_target') and item.search_target is None and item.detection_behavior:
+            if item.search_target is None and item.detection_behavior:
                 item.search_target = self.settings.agent.default_search_target
             
-            if hasattr(item, 'detection_behavior') and item.detection_behavior is None and item.search_target:
+            if item.detection_behavior is None and item.search_target:
                 item.detection_behavior = self.settings.agent.default_detection_behavior
                 fixes.append(f"Set detection behavior: {item.detection_behavior}")
         
@@ -400,11 +426,9 @@ class MissionValidator:
         fixes = []
         
         # Check if coordinates are missing
-        has_lat_lon = (hasattr(item, 'latitude') and item.latitude is not None and 
-                       hasattr(item, 'longitude') and item.longitude is not None)
-        has_mgrs = hasattr(item, 'mgrs') and item.mgrs is not None
-        has_relative = (hasattr(item, 'distance') and item.distance is not None and
-                       hasattr(item, 'heading') and item.heading is not None)
+        has_lat_lon = (item.latitude is not None and item.longitude is not None)
+        has_mgrs = item.mgrs is not None
+        has_relative = (item.distance is not None and item.heading is not None)
         
         if not (has_lat_lon or has_mgrs or has_relative):
             # Special handling for takeoff - use initial coordinates from settings
@@ -429,16 +453,16 @@ class MissionValidator:
         """Find altitude from previous navigation command"""
         for i in range(current_index - 1, -1, -1):
             prev_item = mission.items[i]
-            if (hasattr(prev_item, 'altitude') and prev_item.altitude is not None and
-                getattr(prev_item, 'command_type', None) in ['waypoint', 'takeoff', 'loiter', 'survey']):
+            if (prev_item.altitude is not None and
+                prev_item.command_type in ['waypoint', 'takeoff', 'loiter', 'survey']):
                 return prev_item.altitude
         return None
 
     def _get_takeoff_altitude(self, mission: Mission) -> Optional[float]:
         """Find altitude from takeoff command"""
         for item in mission.items:
-            if (getattr(item, 'command_type', None) == 'takeoff' and 
-                hasattr(item, 'altitude') and item.altitude is not None):
+            if (item.command_type == 'takeoff' and 
+                item.altitude is not None):
                 return item.altitude
         return None
 
@@ -446,17 +470,12 @@ class MissionValidator:
         """Find coordinates from last waypoint or navigation command"""
         for i in range(current_index - 1, -1, -1):
             prev_item = mission.items[i]
-            if (getattr(prev_item, 'command_type', None) in ['waypoint', 'takeoff', 'loiter', 'survey'] and
-                hasattr(prev_item, 'latitude') and prev_item.latitude is not None and
-                hasattr(prev_item, 'longitude') and prev_item.longitude is not None):
+            if (prev_item.command_type in ['waypoint', 'takeoff', 'loiter', 'survey'] and
+                prev_item.latitude is not None and
+                prev_item.longitude is not None):
                 return (prev_item.latitude, prev_item.longitude)
         return None
 
-    def _resequence_items(self, mission: Mission):
-        """Update sequence numbers after insertion/modification"""
-        for i, item in enumerate(mission.items):
-            item.seq = i
-    
     def _convert_relative_to_absolute_coordinates(self, mission: Mission) -> List[str]:
         """Convert all relative positioning to absolute coordinates and clear relative attributes"""
         fixes_applied = []
@@ -476,18 +495,17 @@ class MissionValidator:
         
         for item in mission.items:
             # Skip items that don't support positioning
-            command_type = getattr(item, 'command_type', None)
+            command_type = item.command_type
             if command_type not in ['waypoint', 'loiter', 'survey', 'takeoff']:
                 continue
             
             # Check if item has relative positioning that needs conversion
-            has_relative = (hasattr(item, 'distance') and item.distance is not None and
-                           hasattr(item, 'heading') and item.heading is not None)
+            has_relative = (item.distance is not None and item.heading is not None)
             
             if has_relative:
                 # Determine reference point
-                ref_frame = getattr(item, 'relative_reference_frame', 'origin')
-                distance_units = getattr(item, 'distance_units', 'meters')
+                ref_frame = item.relative_reference_frame
+                distance_units = item.distance_units
                 
                 if ref_frame == 'origin':
                     ref_lat, ref_lon = origin_lat, origin_lon
@@ -495,8 +513,7 @@ class MissionValidator:
                     ref_lat, ref_lon = last_lat, last_lon
                 elif ref_frame == 'self':
                     # For 'self' reference, item should already have absolute coordinates
-                    if (hasattr(item, 'latitude') and item.latitude is not None and
-                        hasattr(item, 'longitude') and item.longitude is not None):
+                    if item.latitude is not None and item.longitude is not None:
                         ref_lat, ref_lon = item.latitude, item.longitude
                     else:
                         # Fall back to last waypoint if no self coordinates
@@ -522,8 +539,7 @@ class MissionValidator:
                     item.relative_reference_frame = None
                     
                     # Clear MGRS since we now have lat/lon
-                    if hasattr(item, 'mgrs'):
-                        item.mgrs = None
+                    item.mgrs = None
                     
                     fixes_applied.append(f"Converted item {item.seq + 1} from relative to absolute coordinates: {new_lat:.6f}, {new_lon:.6f}")
                     last_lat, last_lon = new_lat, new_lon
@@ -533,8 +549,7 @@ class MissionValidator:
                     pass
             
             # Update last known coordinates for next item
-            elif (hasattr(item, 'latitude') and item.latitude is not None and
-                  hasattr(item, 'longitude') and item.longitude is not None):
+            elif item.latitude is not None and item.longitude is not None:
                 last_lat, last_lon = item.latitude, item.longitude
         
         return fixes_applied
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for serving the PX4 Agent in production
+Usage: gunicorn -c gunicorn_conf.py 'server:create_app()'  (or: python3 server.py --gunicorn)
+"""
+
+import os
+
+bind = f"{os.getenv('PX4_AGENT_HOST', '0.0.0.0')}:{os.getenv('PX4_AGENT_PORT', '5000')}"
+
+# Single worker process: the LLM (GPU memory) and the in-memory mission state
+# belong to one PX4Agent instance and cannot be shared across processes.
+# Concurrency comes from threads instead of the dev server's ad-hoc threading.
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv('PX4_AGENT_THREADS', '32'))
+
+# Pending connections allowed to queue while all threads are busy
+backlog = 2048
+
+# LLM inference for a full mission request can take minutes. The worker also
+# builds the app at boot, which includes one warmup model call (model load and
+# prompt processing), so a cold model must be ready within this window too.
+timeout = 300
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv('PX4_AGENT_LOG_LEVEL', 'info')
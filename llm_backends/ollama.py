@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional, List
 import json
 import requests
 from langchain_ollama import ChatOllama
+from langchain_core.caches import InMemoryCache
 from langchain_core.language_models import BaseChatModel
 
 from config import get_model_settings
@@ -24,6 +25,8 @@ class OllamaInterface:
         self.top_k = model_settings['top_k']
         self.timeout = 60
         self.max_tokens = model_settings['max_tokens']
+        self.response_cache = model_settings.get('response_cache', False)
+        self.response_cache_size = model_settings.get('response_cache_size', 256)
         
         self._llm = None
         self._initialize_model()
@@ -38,7 +41,9 @@ class OllamaInterface:
                 top_p=self.top_p,
                 top_k=self.top_k,
                 timeout=self.timeout,
-                num_predict=self.max_tokens
+                num_predict=self.max_tokens,
+                # None falls back to the (unset) global LLM cache, i.e. no caching
+                cache=InMemoryCache(maxsize=self.response_cache_size) if self.response_cache else None
                 # Removed format="json" - this breaks LangChain tool calling
             )
         except Exception as e:
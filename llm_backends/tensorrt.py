@@ -11,6 +11,7 @@ import traceback
 import uuid
 from pathlib import Path
 
+from langchain_core.caches import InMemoryCache
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
     BaseMessage,
@@ -49,11 +50,37 @@ except (ImportError, OSError, Exception) as import_error:
     ModelRunner = None
     SamplingParams = None
 
+
+def _format_tools_prompt(tool_definitions: List[Dict[str, Any]]) -> str:
+    """Build the system-prompt block describing the available tools (matches Ollama's format)"""
+    parts = [
+        "\n# Tools\n\n",
+        "You may call one or more functions to assist with the user query.\n\n",
+        "You are provided with function signatures within <tools></tools> XML tags:\n",
+        "<tools>\n",
+    ]
+    for tool in tool_definitions:
+        # Match Ollama's format: {"type": "function", "function": {...}}
+        parts.append(json.dumps({"type": "function", "function": tool.get("function", tool)}, ensure_ascii=False) + "\n")
+    parts.append("</tools>\n\n")
+    parts.append("For each function call, return a json object with function name and arguments within <tool_call></tool_call> XML tags:\n")
+    parts.append("<tool_call>\n")
+    parts.append('{"name": <function-name>, "arguments": <args-json-object>}\n')
+    parts.append("</tool_call>\n")
+    return "".join(parts)
+
+
 class TensorRTInterface(BaseChatModel):
     """Interface for TensorRT-LLM optimized model communication"""
     
     def __init__(self, model_name: Optional[str] = None, model_path: Optional[str] = None):
-        super().__init__()
+        model_settings = get_model_settings()
+        
+        # None falls back to the (unset) global LLM cache, i.e. no caching
+        super().__init__(
+            cache=InMemoryCache(maxsize=model_settings.get('response_cache_size', 256))
+            if model_settings.get('response_cache') else None
+        )
 
         if not TENSORRT_AVAILABLE:
             error_message_lines = [
@@ -76,8 +103,6 @@ class TensorRTInterface(BaseChatModel):
 
             raise ImportError("\n".join(error_message_lines))
 
-        model_settings = get_model_settings()
-        
         # BaseChatModel inherits from Pydantic's BaseModel which prevents setting
         # new attributes via normal assignment. Use object.__setattr__ so these
         # configuration values are stored without tripping validation.
@@ -163,6 +188,7 @@ class TensorRTInterface(BaseChatModel):
         self,
         messages: List[BaseMessage],
         tool_definitions: Optional[List[Dict[str, Any]]] = None,
+        tools_prompt: Optional[str] = None,
     ) -> str:
         """Format messages using ChatML chat format (compatible with Qwen, Llama3, Mistral, and many other models)"""
 
@@ -185,18 +211,8 @@ class TensorRTInterface(BaseChatModel):
                 formatted_prompt += system_content + "\n"
 
             if tool_definitions:
-                formatted_prompt += "\n# Tools\n\n"
-                formatted_prompt += "You may call one or more functions to assist with the user query.\n\n"
-                formatted_prompt += "You are provided with function signatures within <tools></tools> XML tags:\n"
-                formatted_prompt += "<tools>\n"
-                for tool in tool_definitions:
-                    # Match Ollama's format: {"type": "function", "function": {...}}
-                    formatted_prompt += json.dumps({"type": "function", "function": tool.get("function", tool)}, ensure_ascii=False) + "\n"
-                formatted_prompt += "</tools>\n\n"
-                formatted_prompt += "For each function call, return a json object with function name and arguments within <tool_call></tool_call> XML tags:\n"
-                formatted_prompt += "<tool_call>\n"
-                formatted_prompt += '{"name": <function-name>, "arguments": <args-json-object>}\n'
-                formatted_prompt += "</tool_call>\n"
+                # Tool signatures are fixed per bind_tools() call - reuse the prebuilt block when given
+                formatted_prompt += tools_prompt or _format_tools_prompt(tool_definitions)
 
             formatted_prompt += "<|im_end|>\n"
 
@@ -444,13 +460,14 @@ class TensorRTInterface(BaseChatModel):
             # Extract tool metadata if present (bound via .bind_tools())
             tool_definitions = None
             tool_choice = None
+            tools_prompt = kwargs.pop("tools_prompt", None)
             if "tools" in kwargs:
                 tool_definitions = kwargs.pop("tools")
             if "tool_choice" in kwargs:
                 tool_choice = kwargs.pop("tool_choice")
 
             # Format messages using ChatML format
-            prompt = self._format_messages(messages, tool_definitions)
+            prompt = self._format_messages(messages, tool_definitions, tools_prompt)
 
             # Tokenize prompt
             input_ids = self._tokenizer.encode(prompt, add_special_tokens=False)
@@ -618,4 +635,6 @@ class TensorRTInterface(BaseChatModel):
         formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
         if tool_choice is not None:
             kwargs["tool_choice"] = tool_choice
+        # Serialize the tool signatures once here instead of on every generation
+        kwargs["tools_prompt"] = _format_tools_prompt(formatted_tools)
         return super().bind(tools=formatted_tools, **kwargs)
@@ -7,16 +7,99 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, request, jsonify, send_from_directory, send_file
+from flask import Flask, Response, request, jsonify, send_from_directory, send_file
 from flask_cors import CORS
-from typing import Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from typing import Dict, Any, Optional, Tuple, Type
 import traceback
 import logging
+import time
+import orjson
 
 from core import PX4Agent
 from config import get_settings, reload_settings, update_takeoff_settings, get_current_takeoff_settings, update_current_action_settings, get_current_action_settings
 
 
+# Static responses for missions with nothing to show, serialized once at import
+_NO_MISSION_RESPONSE = orjson.dumps({
+    "success": True,
+    "mission_summary": None,
+    "mission_state": None
+})
+_EMPTY_MISSION_REVIEW_RESPONSE = orjson.dumps({
+    "success": True,
+    "mode": "mission_review",
+    "output": "Mission is empty",
+    "mission_state": None
+})
+
+
+class UserInputBody(BaseModel):
+    """Request body for mission and command mode endpoints"""
+    user_input: str
+
+
+class ConfigBody(BaseModel):
+    """Request body for configuration reload"""
+    config_path: Optional[str] = None
+
+
+class TakeoffSettingsBody(BaseModel):
+    """Request body for takeoff settings update - only provided fields are applied"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    heading: Optional[str] = None
+    altitude: Optional[float] = None
+    altitude_units: Optional[str] = None
+    
+    @field_validator('*', mode='before')
+    @classmethod
+    def reject_null(cls, value: Any) -> Any:
+        """Defaults only mark a field as not provided - an explicit null is not a value"""
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+class CurrentActionSettingsBody(BaseModel):
+    """Request body for current action settings update - only provided fields are applied"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    type: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    altitude: Optional[float] = None
+    altitude_units: Optional[str] = None
+    radius: Optional[float] = None
+    radius_units: Optional[str] = None
+    heading: Optional[str] = None
+    search_target: Optional[str] = None
+    detection_behavior: Optional[str] = None
+    
+    @field_validator('*', mode='before')
+    @classmethod
+    def reject_null(cls, value: Any) -> Any:
+        """Defaults only mark a field as not provided - an explicit null is not a value"""
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+def _parse_json(model: Type[BaseModel]) -> BaseModel:
+    """Parse and validate the raw request body in a single pass"""
+    return model.model_validate_json(request.get_data(cache=False) or b'{}')
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Flatten pydantic validation errors into a single message"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc']) or 'body'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
 class PX4AgentServer:
     """Flask server hosting PX4Agent"""
     
@@ -28,12 +111,19 @@ class PX4AgentServer:
         self.agent: Optional[PX4Agent] = None
         self.verbose = verbose
         
+        # Serialized mission state keyed on (mission manager, mission version)
+        self._mission_state_cache: Optional[Tuple[Any, int, bytes]] = None
+        
         # Setup logging
         if not verbose:
             logging.getLogger('werkzeug').setLevel(logging.WARNING)
         
         self._setup_routes()
         self._initialize_agent()
+        
+        # Only at process start - POST /api/config reloads skip it so they return promptly
+        if self.agent:
+            self._warmup_agent()
     
     def _clean_result_for_json(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Clean result dictionary to ensure JSON serialization"""
@@ -62,8 +152,34 @@ class PX4AgentServer:
         
         return cleaned
     
+    def _mission_state_json(self) -> bytes:
+        """Get absolute-coordinate mission state as JSON, reusing the last
+        serialization while the mission version is unchanged (caller holds the mission lock)"""
+        mission_manager = self.agent.mission_manager if self.agent else None
+        mission = mission_manager.get_mission() if mission_manager else None
+        if not mission:
+            return b"null"
+        
+        version = mission_manager.version
+        cached = self._mission_state_cache
+        if cached and cached[0] is mission_manager and cached[1] == version:
+            return cached[2]
+        
+        # Serialize one item at a time rather than building the full dict list first
+        state = (b'{"items":[' +
+                 b','.join(orjson.dumps(item_dict) for item_dict in mission.iter_item_dicts(convert_to_absolute=True)) +
+                 b'],"created_at":' + orjson.dumps(mission.created_at.isoformat()) +
+                 b',"modified_at":' + orjson.dumps(mission.modified_at.isoformat()) + b'}')
+        self._mission_state_cache = (mission_manager, version, state)
+        return state
+    
+    def _invalidate_mission_state_cache(self):
+        """Drop cached mission state (absolute coordinates depend on takeoff settings)"""
+        self._mission_state_cache = None
+    
     def _initialize_agent(self):
         """Initialize the PX4Agent instance"""
+        self._invalidate_mission_state_cache()
         try:
             self.agent = PX4Agent(verbose=self.verbose)
             print(f"🚁 PX4Agent initialized (verbose={self.verbose})")
@@ -71,6 +187,16 @@ class PX4AgentServer:
             print(f"❌ Failed to initialize PX4Agent: {e}")
             self.agent = None
     
+    def _warmup_agent(self):
+        """Run one throwaway model call so the first request is not a cold start"""
+        start = time.perf_counter()
+        try:
+            self.agent.warmup()
+            print(f"✅ Warmup complete in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            # Warmup is best effort - the agent still works, just slower on first request
+            print(f"⚠️ Warmup skipped: {e}")
+    
     def _setup_routes(self):
         """Setup Flask routes"""
         
@@ -104,16 +230,16 @@ class PX4AgentServer:
                 }), 500
             
             try:
-                data = request.get_json()
-                if not data or 'user_input' not in data:
+                try:
+                    body = _parse_json(UserInputBody)
+                except ValidationError as e:
                     return jsonify({
                         "success": False,
-                        "error": "Missing user_input in request",
+                        "error": _format_validation_error(e),
                         "output": "Invalid request format"
                     }), 400
                 
-                user_input = data['user_input']
-                result = self.agent.mission_mode(user_input)
+                result = self.agent.mission_mode(body.user_input)
                 
                 # Clean result for JSON serialization
                 clean_result = self._clean_result_for_json(result)
@@ -142,16 +268,16 @@ class PX4AgentServer:
                 }), 500
             
             try:
-                data = request.get_json()
-                if not data or 'user_input' not in data:
+                try:
+                    body = _parse_json(UserInputBody)
+                except ValidationError as e:
                     return jsonify({
                         "success": False,
-                        "error": "Missing user_input in request",
+                        "error": _format_validation_error(e),
                         "output": "Invalid request format"
                     }), 400
                 
-                user_input = data['user_input']
-                result = self.agent.command_mode(user_input)
+                result = self.agent.command_mode(body.user_input)
                 
                 # Clean result for JSON serialization
                 clean_result = self._clean_result_for_json(result)
@@ -178,15 +304,19 @@ class PX4AgentServer:
                     "error": "PX4Agent not initialized"
                 }), 500
             
+            mission_manager = self.agent.mission_manager
+            if mission_manager is None or not mission_manager.has_mission():
+                return Response(_NO_MISSION_RESPONSE, mimetype='application/json')
+            
             try:
-                mission_summary = self.agent.get_mission_summary()
-                mission = self.agent.mission_manager.get_mission() if self.agent.mission_manager else None
+                # Hold the mission lock so summary and state describe the same mission
+                with mission_manager.lock:
+                    # Summary runs validation (which may auto-fix and bump the version), so build it first
+                    mission_summary = self.agent.get_mission_summary()
+                    mission_state = self._mission_state_json()
                 
-                return jsonify({
-                    "success": True,
-                    "mission_summary": mission_summary,
-                    "mission_state": mission.to_dict(convert_to_absolute=True) if mission else None
-                })
+                body = b'{"success":true,"mission_summary":' + orjson.dumps(mission_summary) + b',"mission_state":' + mission_state + b'}'
+                return Response(body, mimetype='application/json')
                 
             except Exception as e:
                 return jsonify({
@@ -203,23 +333,22 @@ class PX4AgentServer:
                     "error": "PX4Agent not initialized"
                 }), 500
             
+            mission_manager = self.agent.mission_manager
+            if mission_manager is None or mission_manager.is_empty():
+                return Response(_EMPTY_MISSION_REVIEW_RESPONSE, mimetype='application/json')
+            
             try:
-                mission = self.agent.mission_manager.get_mission() if self.agent.mission_manager else None
-                
-                if mission and mission.items:
-                    return jsonify({
-                        "success": True,
-                        "mode": "mission_review",
-                        "output": f"Mission review: {len(mission.items)} items",
-                        "mission_state": mission.to_dict(convert_to_absolute=True)
-                    })
-                else:
-                    return jsonify({
+                with mission_manager.lock:
+                    mission = mission_manager.get_mission()
+                    header = orjson.dumps({
                         "success": True,
                         "mode": "mission_review",
-                        "output": "Mission is empty",
-                        "mission_state": None
+                        "output": f"Mission review: {len(mission.items)} items"
                     })
+                    mission_state = self._mission_state_json()
+                
+                body = header[:-1] + b',"mission_state":' + mission_state + b'}'
+                return Response(body, mimetype='application/json')
                     
             except Exception as e:
                 return jsonify({
@@ -231,11 +360,16 @@ class PX4AgentServer:
         def update_config():
             """Reload configuration"""
             try:
-                data = request.get_json()
-                config_path = data.get('config_path') if data else None
+                try:
+                    body = _parse_json(ConfigBody)
+                except ValidationError as e:
+                    return jsonify({
+                        "success": False,
+                        "error": _format_validation_error(e)
+                    }), 400
                 
-                if config_path:
-                    reload_settings(config_path)
+                if body.config_path:
+                    reload_settings(body.config_path)
                 
                 # Reinitialize agent with new settings
                 self._initialize_agent()
@@ -258,7 +392,7 @@ class PX4AgentServer:
                 settings = get_current_takeoff_settings()
                 return jsonify({
                     "success": True,
-                    "settings": settings
+                    "settings": dict(settings)
                 })
             except Exception as e:
                 return jsonify({
@@ -270,44 +404,26 @@ class PX4AgentServer:
         def update_takeoff_settings_endpoint():
             """Update takeoff settings at runtime"""
             try:
-                data = request.get_json()
-                if not data:
+                try:
+                    body = _parse_json(TakeoffSettingsBody)
+                except ValidationError as e:
                     return jsonify({
                         "success": False,
-                        "error": "No data provided"
+                        "error": f"Invalid data format: {_format_validation_error(e)}"
                     }), 400
                 
                 # Check if at least one field is provided
-                valid_fields = ['latitude', 'longitude', 'heading', 'altitude', 'altitude_units']
-                provided_fields = [field for field in valid_fields if field in data]
-                if not provided_fields:
+                if not body.model_fields_set:
                     return jsonify({
                         "success": False,
-                        "error": f"At least one field must be provided: {', '.join(valid_fields)}"
+                        "error": f"At least one field must be provided: {', '.join(TakeoffSettingsBody.model_fields)}"
                     }), 400
                 
-                # Extract and validate provided fields
-                kwargs = {}
-                
-                try:
-                    if 'latitude' in data:
-                        kwargs['latitude'] = float(data['latitude'])
-                    if 'longitude' in data:
-                        kwargs['longitude'] = float(data['longitude'])
-                    if 'heading' in data:
-                        kwargs['heading'] = str(data['heading']).strip()
-                    if 'altitude' in data:
-                        kwargs['altitude'] = float(data['altitude'])
-                    if 'altitude_units' in data:
-                        kwargs['altitude_units'] = str(data['altitude_units']).strip()
-                except (ValueError, TypeError) as e:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Invalid data format: {str(e)}"
-                    }), 400
+                kwargs = body.model_dump(exclude_unset=True)
                 
                 # Update settings with provided values only
                 update_takeoff_settings(**kwargs)
+                self._invalidate_mission_state_cache()
                 
                 # Get updated settings for response
                 updated_settings = get_current_takeoff_settings()
@@ -315,7 +431,7 @@ class PX4AgentServer:
                 return jsonify({
                     "success": True,
                     "message": "Takeoff settings updated successfully",
-                    "settings": updated_settings
+                    "settings": dict(updated_settings)
                 })
                 
             except ValueError as e:
@@ -336,7 +452,7 @@ class PX4AgentServer:
                 settings = get_current_action_settings()
                 return jsonify({
                     "success": True,
-                    "settings": settings
+                    "settings": dict(settings)
                 })
             except Exception as e:
                 return jsonify({
@@ -348,71 +464,40 @@ class PX4AgentServer:
         def update_current_action_settings_endpoint():
             """Update current action settings at runtime"""
             try:
-                data = request.get_json()
-                if not data:
+                try:
+                    body = _parse_json(CurrentActionSettingsBody)
+                except ValidationError as e:
                     return jsonify({
                         "success": False,
-                        "error": "No data provided"
+                        "error": f"Invalid data format: {_format_validation_error(e)}"
                     }), 400
                 
                 # Check if at least action type or one field is provided
-                valid_fields = ['type', 'latitude', 'longitude', 'altitude', 'altitude_units', 'radius', 'radius_units', 'heading', 'search_target', 'detection_behavior']
-                provided_fields = [field for field in valid_fields if field in data]
-                if not provided_fields:
+                if not body.model_fields_set:
                     return jsonify({
                         "success": False,
-                        "error": f"At least one field must be provided: {', '.join(valid_fields)}"
+                        "error": f"At least one field must be provided: {', '.join(CurrentActionSettingsBody.model_fields)}"
                     }), 400
                 
-                # Get current settings first
-                current_settings = get_current_action_settings()
-                
-                # Extract and validate provided fields
-                action_type = current_settings['type']
-                latitude = current_settings['latitude']
-                longitude = current_settings['longitude']
-                altitude = current_settings['altitude']
-                altitude_units = current_settings['altitude_units']
-                radius = current_settings['radius']
-                radius_units = current_settings['radius_units']
-                heading = current_settings['heading']
-                search_target = current_settings['search_target']
-                detection_behavior = current_settings['detection_behavior']
+                # Merge provided fields over the current settings
+                merged = {**get_current_action_settings(), **body.model_dump(exclude_unset=True)}
+                action_type = merged['type']
+                latitude = merged['latitude']
+                longitude = merged['longitude']
+                altitude = merged['altitude']
+                altitude_units = merged['altitude_units']
+                radius = merged['radius']
+                radius_units = merged['radius_units']
+                heading = merged['heading']
+                search_target = merged['search_target']
+                detection_behavior = merged['detection_behavior']
                 
-                try:
-                    if 'type' in data:
-                        action_type = str(data['type']).strip()
-                        # Validate action type
-                        allowed_types = ['takeoff', 'waypoint', 'loiter', 'survey']
-                        if action_type not in allowed_types:
-                            return jsonify({
-                                "success": False,
-                                "error": f"Invalid action type '{action_type}'. Allowed types: {', '.join(allowed_types)}"
-                            }), 400
-                    
-                    if 'latitude' in data:
-                        latitude = float(data['latitude'])
-                    if 'longitude' in data:
-                        longitude = float(data['longitude'])
-                    if 'altitude' in data:
-                        altitude = float(data['altitude'])
-                    if 'altitude_units' in data:
-                        altitude_units = str(data['altitude_units']).strip()
-                    if 'radius' in data:
-                        radius = float(data['radius'])
-                    if 'radius_units' in data:
-                        radius_units = str(data['radius_units']).strip()
-                    if 'heading' in data:
-                        heading = str(data['heading']).strip()
-                    if 'search_target' in data:
-                        search_target = str(data['search_target']).strip()
-                    if 'detection_behavior' in data:
-                        detection_behavior = str(data['detection_behavior']).strip()
-                        
-                except (ValueError, TypeError) as e:
+                # Validate action type
+                allowed_types = ['takeoff', 'waypoint', 'loiter', 'survey']
+                if action_type not in allowed_types:
                     return jsonify({
                         "success": False,
-                        "error": f"Invalid data format: {str(e)}"
+                        "error": f"Invalid action type '{action_type}'. Allowed types: {', '.join(allowed_types)}"
                     }), 400
                 
                 # Update settings with merged values
@@ -467,19 +552,76 @@ class PX4AgentServer:
         self.app.run(host=host, port=port, debug=debug)
 
 
+def _env_flag(name: str) -> bool:
+    """Read a boolean environment variable (useful for Docker)"""
+    return os.getenv(name, '').lower() in ('true', '1', 'yes')
+
+
+def create_app(verbose: Optional[bool] = None, config_path: Optional[str] = None) -> Flask:
+    """App factory for WSGI servers, e.g. gunicorn -c gunicorn_conf.py 'server:create_app()'"""
+    config_path = config_path or os.getenv('PX4_AGENT_CONFIG')
+    if config_path:
+        reload_settings(config_path)
+        print(f"📝 Loaded configuration from {config_path}")
+    
+    if verbose is None:
+        verbose = _env_flag('VERBOSE')
+    
+    return PX4AgentServer(verbose=verbose).app
+
+
+def _exec_gunicorn(host: Optional[str], port: Optional[int], threads: Optional[int], verbose: bool, config_path: Optional[str]):
+    """Replace this process with gunicorn serving create_app()"""
+    server_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # create_app() runs inside the gunicorn worker, so hand settings over via environment
+    if config_path:
+        os.environ['PX4_AGENT_CONFIG'] = os.path.abspath(config_path)
+    if verbose:
+        os.environ['VERBOSE'] = 'true'
+    
+    # gunicorn_conf.py reads bind/threads from the environment - only override what was given
+    # explicitly, so PX4_AGENT_HOST/PORT/THREADS still apply otherwise
+    if host is not None:
+        os.environ['PX4_AGENT_HOST'] = host
+    if port is not None:
+        os.environ['PX4_AGENT_PORT'] = str(port)
+    if threads is not None:
+        os.environ['PX4_AGENT_THREADS'] = str(threads)
+    
+    os.execvp('gunicorn', [
+        'gunicorn',
+        '--config', os.path.join(server_dir, 'gunicorn_conf.py'),
+        '--chdir', server_dir,
+        'server:create_app()'
+    ])
+
+
 def main():
     """Main server entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description="PX4 Agent Flask Server")
-    parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
-    parser.add_argument("--port", type=int, default=5000, help="Port to bind to")
+    parser.add_argument("--host", help="Host to bind to (default: 0.0.0.0, or PX4_AGENT_HOST with --gunicorn)")
+    parser.add_argument("--port", type=int, help="Port to bind to (default: 5000, or PX4_AGENT_PORT with --gunicorn)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     parser.add_argument("--debug", action="store_true", help="Enable Flask debug mode")
     parser.add_argument("--config", "-c", type=str, help="Path to configuration file")
+    parser.add_argument("--gunicorn", action="store_true", help="Serve with gunicorn instead of the Flask development server")
+    parser.add_argument("--threads", type=int, help="Request threads for the gunicorn worker (default: PX4_AGENT_THREADS or 32)")
     
     args = parser.parse_args()
 
+    # Support environment variable for verbose mode (useful for Docker)
+    verbose = args.verbose or _env_flag('VERBOSE')
+
+    if args.gunicorn:
+        try:
+            _exec_gunicorn(args.host, args.port, args.threads, verbose, args.config)
+        except OSError as e:
+            print(f"❌ Failed to start gunicorn: {e}")
+            return 1
+
     # Load configuration if specified
     if args.config:
         try:
@@ -489,13 +631,14 @@ def main():
             print(f"❌ Error loading config: {e}")
             return 1
 
-    # Support environment variable for verbose mode (useful for Docker)
-    verbose = args.verbose or os.getenv('VERBOSE', '').lower() in ('true', '1', 'yes')
-
     # Create and run server
     try:
         server = PX4AgentServer(verbose=verbose)
-        server.run(host=args.host, port=args.port, debug=args.debug)
+        server.run(
+            host=args.host if args.host is not None else "0.0.0.0",
+            port=args.port if args.port is not None else 5000,
+            debug=args.debug
+        )
     except Exception as e:
         print(f"❌ Server failed to start: {e}")
         return 1
@@ -504,4 +647,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Fast path tool argument validation must match full Pydantic validation
+"""
+
+import pytest
+from langchain_core.tools import BaseTool
+from pydantic import ValidationError
+
+# core must be imported before tools (tools.tools imports from core)
+from core import MissionManager
+from tools import get_tools_for_mode
+from tools.fast_validator import fast_validate, get_fast_schema
+
+
+def _tools_by_schema():
+    """One tool instance per distinct args schema across all modes"""
+    tools = {}
+    for mode in ("mission", "command"):
+        for tool in get_tools_for_mode(MissionManager(mode=mode), mode):
+            tools.setdefault(tool.args_schema, tool)
+    return list(tools.values())
+
+
+TOOLS = _tools_by_schema()
+
+# Values an LLM tool call may plausibly send for any field, valid or not
+CANDIDATE_VALUES = [
+    None, "", "north", "  padded  ", "150 feet", "100", "41.9, -87.6",
+    0, 3, -1, 2 ** 60, 100.5, 3.0, float("inf"), True, False,
+    (41.9, -87.6), [41.9, -87.6], {"lat": 41.9}, b"bytes",
+]
+
+
+def _required_input(schema):
+    """Smallest valid input: required fields only"""
+    return {name: 1 for name, field in schema.model_fields.items() if field.is_required()}
+
+
+def _inputs_for(schema):
+    """Required-only input, plus every candidate value in every field, plus the odd cases"""
+    base = _required_input(schema)
+    yield {}
+    yield dict(base)
+    yield {**base, "unknown_field": "ignored"}
+    for name in schema.model_fields:
+        for value in CANDIDATE_VALUES:
+            yield {**base, name: value}
+
+
+def _typed(args):
+    """Compare values by type as well as equality (1 == 1.0 and (1,) != [1] matter to _run)"""
+    return {name: (type(value), repr(value)) for name, value in args.items()}
+
+
+def _parse(parse_input, tool_input):
+    """Run a _parse_input implementation, capturing validation errors for comparison"""
+    try:
+        return _typed(parse_input(dict(tool_input), None))
+    except ValidationError as e:
+        return e.errors(include_url=False)
+
+
+def test_every_tool_schema_compiles():
+    """All tools opt into the fast path, so each schema must compile or it silently falls back"""
+    for tool in TOOLS:
+        assert tool.strict_fast
+        assert get_fast_schema(tool.args_schema) is not None, tool.name
+
+
+@pytest.mark.parametrize("tool", TOOLS, ids=lambda tool: tool.name)
+def test_fast_validate_matches_model_validate(tool):
+    """Whatever the fast path accepts must equal Pydantic's validated field values"""
+    schema = tool.args_schema
+    accepted = 0
+    for tool_input in _inputs_for(schema):
+        fast = fast_validate(schema, dict(tool_input))
+        if fast is None:
+            continue
+        accepted += 1
+        model = schema.model_validate(tool_input)
+        assert _typed(fast) == _typed({name: getattr(model, name) for name in schema.model_fields}), tool_input
+    
+    # The fast path must actually be taken for well-typed input
+    assert fast_validate(schema, _required_input(schema)) is not None
+    assert accepted > 0
+
+
+@pytest.mark.parametrize("tool", TOOLS, ids=lambda tool: tool.name)
+def test_parse_input_matches_base_tool(tool):
+    """The strict_fast _parse_input override must hand _run what LangChain would, and fail the same way"""
+    for tool_input in _inputs_for(tool.args_schema):
+        expected = _parse(lambda args, call_id: BaseTool._parse_input(tool, args, call_id), tool_input)
+        assert _parse(tool._parse_input, tool_input) == expected, tool_input
@@ -0,0 +1,112 @@
+"""
+A tool call that fails after editing the mission must leave it exactly as it was
+"""
+
+import pytest
+
+# core must be imported before tools (tools.tools imports from core)
+from core import MissionManager
+from core.mission import MissionItem
+from tools import get_tools_for_mode
+from tools.tools import PX4ToolBase
+
+
+# Builds takeoff, waypoint, loiter, survey, waypoint (+ auto-added RTL)
+SETUP_CALLS = [
+    ("add_takeoff", {"altitude": "100 feet"}),
+    ("add_waypoint", {"coordinates": "41.89, -87.63", "altitude": "200 feet"}),
+    ("add_loiter", {"coordinates": "41.90, -87.64", "radius": "300 feet"}),
+    ("add_survey", {"coordinates": "41.91, -87.62", "radius": "500 feet"}),
+    ("add_waypoint", {"coordinates": "41.88, -87.61"}),
+]
+
+# One mission-editing call per tool type
+TOOL_CALLS = [
+    ("add_waypoint", {"coordinates": "41.87, -87.60"}),
+    ("add_waypoint", {"coordinates": "41.87, -87.60", "seq": 2}),
+    ("add_takeoff", {"altitude": "150 feet"}),
+    ("add_loiter", {"coordinates": "41.87, -87.60", "radius": "100 feet"}),
+    ("add_survey", {"coordinates": "41.87, -87.60", "radius": "200 feet"}),
+    ("add_rtl", {}),
+    ("update_mission_item", {"seq": 3, "radius": "900 feet", "altitude": "250 feet"}),
+    ("delete_mission_item", {"seq": 2}),
+    ("reorder_item", {"seq": 2, "insert_at": 4}),
+    ("move_item", {"seq": 2, "coordinates": "41.95, -87.65"}),
+]
+
+
+@pytest.fixture
+def mission_tools():
+    """Mission mode tools by name, sharing a manager whose mission has one item of each kind"""
+    manager = MissionManager(mode="mission")
+    tools = {tool.name: tool for tool in get_tools_for_mode(manager, "mission")}
+    manager.create_mission()
+    for name, args in SETUP_CALLS:
+        tools[name].invoke(args)
+    return manager, tools
+
+
+def _snapshot(mission):
+    """Item identities and every field, so both structure and in-place edits are compared"""
+    return [(id(item), dict(item.__dict__)) for item in mission.items]
+
+
+def _failing_validation(self):
+    return False, "forced failure"
+
+
+def _raising_validation(self):
+    raise RuntimeError("forced exception")
+
+
+@pytest.mark.parametrize("name, args", TOOL_CALLS, ids=[f"{name}-{i}" for i, (name, _) in enumerate(TOOL_CALLS)])
+@pytest.mark.parametrize("validation, message", [
+    (_failing_validation, "Planning Error: forced failure"),
+    (_raising_validation, "Error: forced exception"),
+], ids=["invalid", "exception"])
+def test_failed_tool_call_restores_mission(mission_tools, monkeypatch, name, args, validation, message):
+    manager, tools = mission_tools
+    mission = manager.get_mission()
+    before = _snapshot(mission)
+    version = manager.version
+    
+    monkeypatch.setattr(PX4ToolBase, "_validate_mission_after_action", validation)
+    result = tools[name].invoke(args)
+    
+    # The failure must come from validation, i.e. after the edit was applied
+    assert result.startswith(message), result
+    assert _snapshot(mission) == before
+    assert manager.version > version
+
+
+def test_transaction_rollback_undoes_every_journaled_edit():
+    manager = MissionManager(mode="mission")
+    mission = manager.create_mission()
+    for i in range(4):
+        mission.add_item(MissionItem(seq=0, command_type="waypoint", latitude=41.0 + i, longitude=-87.0))
+    before = _snapshot(mission)
+    
+    txn = manager.begin_transaction()
+    mission.add_item(MissionItem(seq=0, command_type="loiter"))
+    mission.insert_item(1, MissionItem(seq=0, command_type="survey"))
+    mission.remove_item(3)
+    mission.record_item_state(mission.items[0])
+    mission.items[0].altitude = 500.0
+    mission.clear_items()
+    mission.add_item(MissionItem(seq=0, command_type="takeoff"))
+    txn.rollback()
+    
+    assert _snapshot(mission) == before
+    assert [item.seq for item in mission.items] == list(range(len(mission.items)))
+
+
+def test_transaction_commit_keeps_edits():
+    manager = MissionManager(mode="mission")
+    mission = manager.create_mission()
+    
+    txn = manager.begin_transaction()
+    mission.add_item(MissionItem(seq=0, command_type="waypoint"))
+    txn.commit()
+    txn.rollback()
+    
+    assert [item.command_type for item in mission.items] == ["waypoint"]
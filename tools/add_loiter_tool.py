@@ -2,17 +2,20 @@
 Add Loiter Tool - Create circular orbit/loiter pattern
 """
 
-from typing import Optional, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
 from config.settings import get_agent_settings
-from core.parsing import parse_altitude, parse_distance, parse_radius, parse_coordinates
+from core.parsing import create_measurement_validator, create_coordinates_validator
 
 # Load agent settings for Field descriptions
 _agent_settings = get_agent_settings()
 
+# Field descriptions that embed configured defaults - formatted once at import
+_RADIUS_DESCRIPTION = f"Radius of the circular orbit with optional units (e.g., '500 feet', '100 meters', '0.5 miles'). Default = {_agent_settings['loiter_default_radius']} {_agent_settings['loiter_radius_units']}"
+_ALTITUDE_DESCRIPTION = f"Altitude for the orbit pattern with optional units (e.g., '150 feet', '50 meters'). Specify only if user mentions height. Default = {_agent_settings['loiter_default_altitude']} {_agent_settings['loiter_altitude_units']}"
+
 class LoiterInput(BaseModel):
     """Create circular orbit/loiter pattern at specified location with defined radius"""
 
@@ -26,50 +29,16 @@ class LoiterInput(BaseModel):
     relative_reference_frame: Optional[str] = Field(None, description="Reference point for distance: 'origin' (takeoff), 'last_waypoint'. You MUST pick one, make an educated guess if using relative positioning. Use 'origin' when user references 'start', 'takeoff', 'here', etc. Otherwise assume last_waypoint.")
     
     # Orbit radius - critical parameter often specified by user
-    radius: Optional[Union[float, str, tuple]] = Field(None, description=f"Radius of the circular orbit with optional units (e.g., '500 feet', '100 meters', '0.5 miles'). Default = {_agent_settings['loiter_default_radius']} {_agent_settings['loiter_radius_units']}")
+    radius: Optional[Union[float, str, tuple]] = Field(None, description=_RADIUS_DESCRIPTION)
     
     # Optional orbit altitude
-    altitude: Optional[Union[float, str, tuple]] = Field(None, description=f"Altitude for the orbit pattern with optional units (e.g., '150 feet', '50 meters'). Specify only if user mentions height. Default = {_agent_settings['loiter_default_altitude']} {_agent_settings['loiter_altitude_units']}")
-    
-    @field_validator('distance', mode='before')
-    @classmethod
-    def parse_distance_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_distance(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
-    
-    @field_validator('radius', mode='before')
-    @classmethod
-    def parse_radius_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_radius(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    altitude: Optional[Union[float, str, tuple]] = Field(None, description=_ALTITUDE_DESCRIPTION)
     
-    @field_validator('altitude', mode='before')
-    @classmethod
-    def parse_altitude_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_altitude(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
-    
-    @field_validator('coordinates', mode='before')
-    @classmethod
-    def parse_coordinates_field(cls, v):
-        if v is None:
-            return None
-        lat, lon = parse_coordinates(v)
-        if lat is None or lon is None:
-            return v  # Let Pydantic handle validation error
-        return (lat, lon)
+    # Shared 'before' validators - turn unit strings into (value, units) tuples
+    parse_distance_field = field_validator('distance', mode='before')(create_measurement_validator())
+    parse_radius_field = field_validator('radius', mode='before')(create_measurement_validator())
+    parse_altitude_field = field_validator('altitude', mode='before')(create_measurement_validator())
+    parse_coordinates_field = field_validator('coordinates', mode='before')(create_coordinates_validator())
     
     # Insertion position
     seq: Optional[int] = Field(None, description="Position to insert loiter in mission (1-based index). The loiter will be inserted AT this position, shifting existing items down. Example: seq=2 means the new loiter becomes item #2, and the old item #2 becomes item #3. Omit to add at end.")
@@ -83,6 +52,7 @@ class AddLoiterTool(PX4ToolBase):
     name: str = "add_loiter"
     description: str = "Add circular orbit/loiter pattern at specified location. Use when user wants drone to fly in circles, orbit, or loiter. The drone can perform AI searches with its camera while loitering. Use for commands like 'orbit', 'circle', 'loiter', or when radius is mentioned like 'circle 2 miles north with 200m radius'. Specify Lat/Long OR MGRS OR distance/heading/reference. Do not mix location systems."
     args_schema: type = LoiterInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
@@ -92,6 +62,7 @@ class AddLoiterTool(PX4ToolBase):
              relative_reference_frame: Optional[str] = None, altitude: Optional[Union[float, tuple]] = None,
              radius: Optional[Union[float, tuple]] = None, seq: Optional[int] = None,
              search_target: Optional[str] = None, detection_behavior: Optional[str] = None) -> str:
+        txn = None
         try:
             # Parse measurement tuples from validators
             if isinstance(distance, tuple):
@@ -115,9 +86,6 @@ class AddLoiterTool(PX4ToolBase):
             else:
                 latitude, longitude = None, None
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
-            
             # Build coordinate description following wx-agent pattern
             coord_desc = self._build_coordinate_description(latitude, longitude, mgrs, distance_value, heading, distance_units, relative_reference_frame)
             
@@ -127,6 +95,8 @@ class AddLoiterTool(PX4ToolBase):
             actual_alt = altitude_value if altitude_value is not None else 0.0
             actual_radius = radius_value if radius_value is not None else 50.0  # Default radius
             
+            # Record structural changes for potential rollback
+            txn = self.mission_manager.begin_transaction()
             item = self.mission_manager.add_loiter(
                 actual_lat, actual_lon, actual_alt, actual_radius,
                 radius_units=radius_units,
@@ -148,21 +118,23 @@ class AddLoiterTool(PX4ToolBase):
             is_valid, validation_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {validation_msg}" + self._get_mission_state_summary()
             
+            txn.commit()
+            
             # Build response with preserved units
             altitude_msg = f"{altitude_value} {altitude_units}" if altitude_value is not None else "not specified"
             radius_msg = f"{radius_value} {radius_units}" if radius_value is not None else "not specified"
             
-            response = f"Loiter command added to mission: {coord_desc}, Alt={altitude_msg}, Radius={radius_msg}, (Item {item.seq + 1})"
-            
             # Include auto-fix notifications if any
-            if validation_msg:
-                response += f". {validation_msg}"
-            
-            response += self._get_mission_state_summary()
-            return response
+            return self._build_response(
+                f"Loiter command added to mission: {coord_desc}, Alt={altitude_msg}, Radius={radius_msg}, (Item {item.seq + 1})",
+                validation_msg
+            )
             
         except Exception as e:
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
             return f"Error: {str(e)}"
\ No newline at end of file
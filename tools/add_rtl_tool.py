@@ -2,48 +2,41 @@
 Add RTL Tool - Return to launch command
 """
 
-from typing import Optional, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
 from config.settings import get_agent_settings
-from core.parsing import parse_altitude
+from core.parsing import create_measurement_validator
 
 # Load agent settings for Field descriptions
 _agent_settings = get_agent_settings()
 
+# Field descriptions that embed configured defaults - formatted once at import
+_ALTITUDE_DESCRIPTION = f"Landing altitude for RTL with optional units (e.g., '20 feet', '5 meters'). Specify only if user mentions specific landing height. Default = {_agent_settings['rtl_default_altitude']} {_agent_settings['rtl_altitude_units']}"
+
 
 class RTLInput(BaseModel):
     """Return to launch - automatically fly back to takeoff point and land"""
     
     # Optional altitude specification
-    altitude: Optional[Union[float, str, tuple]] = Field(None, description=f"Landing altitude for RTL with optional units (e.g., '20 feet', '5 meters'). Specify only if user mentions specific landing height. Default = {_agent_settings['rtl_default_altitude']} {_agent_settings['rtl_altitude_units']}")
+    altitude: Optional[Union[float, str, tuple]] = Field(None, description=_ALTITUDE_DESCRIPTION)
     
-    @field_validator('altitude', mode='before')
-    @classmethod
-    def parse_altitude_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_altitude(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    # Shared 'before' validator - turns unit strings into (value, units) tuples
+    parse_altitude_field = field_validator('altitude', mode='before')(create_measurement_validator())
 
 
 class AddRTLTool(PX4ToolBase):
     name: str = "add_rtl"
     description: str = "Add return to launch command to automatically fly back to takeoff point and land. Always inserted as the LAST mission item. Use when the drone should return home, land, or come back."
     args_schema: type = RTLInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
     
     def _run(self, altitude: Optional[Union[float, tuple]] = None) -> str:
-        # Create response
-        response = ""
-
-        # Populate response
+        txn = None
         try:
             # Parse measurement tuples from validators
             if isinstance(altitude, tuple):
@@ -51,8 +44,14 @@ class AddRTLTool(PX4ToolBase):
             else:
                 altitude_value, altitude_units = altitude, 'meters'
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
+            # A second RTL can never validate - reject it before touching the mission when the
+            # validator's answer is already known
+            duplicate_error = self.mission_manager.appended_rtl_error()
+            if duplicate_error:
+                return f"Planning Error: {duplicate_error}" + self._get_mission_state_summary()
+            
+            # Record mission changes for potential rollback
+            txn = self.mission_manager.begin_transaction()
             
             item = self.mission_manager.add_return_to_launch(
                 altitude=altitude_value,
@@ -63,19 +62,21 @@ class AddRTLTool(PX4ToolBase):
             is_valid, validation_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {validation_msg}" + self._get_mission_state_summary()
             else:
+                txn.commit()
+                
                 altitude_msg = f" at {altitude_value} {altitude_units}" if altitude_value is not None else ""
-                response = f"Return to Launch command added to mission{altitude_msg} (Item {item.seq + 1})"
                 
                 # Include auto-fix notifications if any
-                if validation_msg:
-                    response += f". {validation_msg}"
-                
-                response += self._get_mission_state_summary()
+                return self._build_response(
+                    f"Return to Launch command added to mission{altitude_msg} (Item {item.seq + 1})",
+                    validation_msg
+                )
             
         except Exception as e:
-            response = f"Error: {str(e)}"
-
-        return response
\ No newline at end of file
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
+            return f"Error: {str(e)}"
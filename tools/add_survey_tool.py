@@ -2,17 +2,20 @@
 Add Survey Tool - Create systematic survey patterns for area coverage
 """
 
-from typing import Optional, List, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, List, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
 from config.settings import get_agent_settings
-from core.parsing import parse_altitude, parse_distance, parse_radius, parse_coordinates
+from core.parsing import create_measurement_validator, create_coordinates_validator
 
 # Load agent settings for Field descriptions
 _agent_settings = get_agent_settings()
 
+# Field descriptions that embed configured defaults - formatted once at import
+_RADIUS_DESCRIPTION = f"Radius of circular survey area with optional units (e.g., '1 mile', '500 meters', '1000 ft'). Default = {_agent_settings['survey_default_radius']} {_agent_settings['survey_radius_units']}"
+_ALTITUDE_DESCRIPTION = f"Flight altitude for the survey pattern with optional units (e.g., '150 feet', '50 meters'). Default = {_agent_settings['survey_default_altitude']} {_agent_settings['survey_altitude_units']}"
+
 
 class SurveyInput(BaseModel):
     """Create survey pattern over specified area using center+radius OR corner points"""
@@ -28,7 +31,7 @@ class SurveyInput(BaseModel):
     relative_reference_frame: Optional[str] = Field(None, description="Reference point for center distance: 'origin' (takeoff), 'last_waypoint'. You MUST pick one, make an educated guess if using relative positioning. Use 'origin' when user references 'start', 'takeoff', 'here', etc. Otherwise assume last_waypoint.")
     
     # Survey area size (for center+radius mode)
-    radius: Optional[Union[float, str, tuple]] = Field(None, description=f"Radius of circular survey area with optional units (e.g., '1 mile', '500 meters', '1000 ft'). Default = {_agent_settings['survey_default_radius']} {_agent_settings['survey_radius_units']}")
+    radius: Optional[Union[float, str, tuple]] = Field(None, description=_RADIUS_DESCRIPTION)
     
     # ===== CORNER POINTS SURVEY =====
     # Corner points defining survey boundary (up to 4 corners for rectangular area)
@@ -47,47 +50,13 @@ class SurveyInput(BaseModel):
     
     # ===== SURVEY PARAMETERS =====
     # Survey flight parameters
-    altitude: Optional[Union[float, str, tuple]] = Field(None, description=f"Flight altitude for the survey pattern with optional units (e.g., '150 feet', '50 meters'). Default = {_agent_settings['survey_default_altitude']} {_agent_settings['survey_altitude_units']}")
-    
-    @field_validator('distance', mode='before')
-    @classmethod
-    def parse_distance_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_distance(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
-    
-    @field_validator('radius', mode='before')
-    @classmethod
-    def parse_radius_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_radius(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    altitude: Optional[Union[float, str, tuple]] = Field(None, description=_ALTITUDE_DESCRIPTION)
     
-    @field_validator('altitude', mode='before')
-    @classmethod
-    def parse_altitude_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_altitude(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
-    
-    @field_validator('coordinates', mode='before')
-    @classmethod
-    def parse_coordinates_field(cls, v):
-        if v is None:
-            return None
-        lat, lon = parse_coordinates(v)
-        if lat is None or lon is None:
-            return v  # Let Pydantic handle validation error
-        return (lat, lon)
+    # Shared 'before' validators - turn unit/coordinate strings into tuples
+    parse_distance_field = field_validator('distance', mode='before')(create_measurement_validator())
+    parse_radius_field = field_validator('radius', mode='before')(create_measurement_validator())
+    parse_altitude_field = field_validator('altitude', mode='before')(create_measurement_validator())
+    parse_coordinates_field = field_validator('coordinates', mode='before')(create_coordinates_validator())
     
     # Insertion position
     seq: Optional[int] = Field(None, description="Position to insert survey in mission (1-based index). The survey will be inserted AT this position, shifting existing items down. Omit to add at end.")
@@ -101,6 +70,7 @@ class AddSurveyTool(PX4ToolBase):
     name: str = "add_survey"
     description: str = "Create survey pattern for area coverage. Two modes: CENTER+RADIUS (specify center point and radius) or CORNER POINTS (define polygon boundary). The drone can perform AI searches for specified targets with its camera while surverying. Use for survey commands like 'survey 1km radius around this point' or 'search the area bounded by these corners'. Specify Lat/Long OR MGRS OR distance/heading/reference. Do not mix location systems."
     args_schema: type = SurveyInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
@@ -114,6 +84,7 @@ class AddSurveyTool(PX4ToolBase):
              corner4_lat: Optional[float] = None, corner4_lon: Optional[float] = None, corner4_mgrs: Optional[str] = None,
              altitude: Optional[Union[float, tuple]] = None,
              seq: Optional[int] = None, search_target: Optional[str] = None, detection_behavior: Optional[str] = None) -> str:
+        txn = None
         try:
             # Parse measurement tuples from validators
             if isinstance(distance, tuple):
@@ -137,22 +108,21 @@ class AddSurveyTool(PX4ToolBase):
             else:
                 latitude, longitude = None, None
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
-            
             # Build corner points list from individual parameters
-            corner_points = []
-            if corner1_lat is not None or corner1_mgrs is not None:
-                corner_points.append({'lat': corner1_lat, 'lon': corner1_lon, 'mgrs': corner1_mgrs})
-            if corner2_lat is not None or corner2_mgrs is not None:
-                corner_points.append({'lat': corner2_lat, 'lon': corner2_lon, 'mgrs': corner2_mgrs})
-            if corner3_lat is not None or corner3_mgrs is not None:
-                corner_points.append({'lat': corner3_lat, 'lon': corner3_lon, 'mgrs': corner3_mgrs})
-            if corner4_lat is not None or corner4_mgrs is not None:
-                corner_points.append({'lat': corner4_lat, 'lon': corner4_lon, 'mgrs': corner4_mgrs})
+            corners = (
+                (corner1_lat, corner1_lon, corner1_mgrs),
+                (corner2_lat, corner2_lon, corner2_mgrs),
+                (corner3_lat, corner3_lon, corner3_mgrs),
+                (corner4_lat, corner4_lon, corner4_mgrs),
+            )
+            corner_points = [
+                {'lat': lat, 'lon': lon, 'mgrs': mgrs}
+                for lat, lon, mgrs in corners
+                if lat is not None or mgrs is not None
+            ]
             
             # Determine survey mode
-            if corner_points and len(corner_points) > 0:
+            if corner_points:
                 # Corner points mode
                 survey_mode = "polygon"
                 area_desc = f"polygon with {len(corner_points)} corners"
@@ -175,17 +145,15 @@ class AddSurveyTool(PX4ToolBase):
                 center_desc = "defined by corner points"
             
             # Set defaults
-            actual_altitude = altitude_value or 100.0
             actual_altitude_units = altitude_units or "meters"
             
+            # Record structural changes for potential rollback
+            txn = self.mission_manager.begin_transaction()
+            
             # Create a survey mission item
             item = self.mission_manager.add_survey(
-                mode=survey_mode,
-                center_lat=latitude or 0.0,
-                center_lon=longitude or 0.0,
-                radius=radius_value or 0.0,
+                survey_mode, latitude or 0.0, longitude or 0.0,
                 corners=corner_points,
-                altitude=actual_altitude,
                 radius_units=radius_units,
                 altitude_units=actual_altitude_units,
                 insert_at=seq,
@@ -206,20 +174,19 @@ class AddSurveyTool(PX4ToolBase):
             is_valid, validation_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {validation_msg}" + self._get_mission_state_summary()
             
-            # Build response with preserved units
-            response = f"Survey pattern created for {area_desc} at {center_desc}, Alt={altitude_value} {altitude_units} (Item {item.seq + 1})"
-            
-            # Include auto-fix notifications if any
-            if validation_msg:
-                response += f". {validation_msg}"
+            txn.commit()
             
-            response += self._get_mission_state_summary()
-            return response
+            # Build response with preserved units and any auto-fix notifications
+            return self._build_response(
+                f"Survey pattern created for {area_desc} at {center_desc}, Alt={altitude_value} {altitude_units} (Item {item.seq + 1})",
+                validation_msg
+            )
             
         except Exception as e:
-            response = f"Error: {str(e)}"
-            
-        return response
\ No newline at end of file
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
+            return f"Error: {str(e)}"
\ No newline at end of file
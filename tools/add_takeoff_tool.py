@@ -2,17 +2,19 @@
 Add Takeoff Tool - Launch drone from ground to flight altitude
 """
 
-from typing import Optional, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
 from config.settings import get_agent_settings
-from core.parsing import parse_altitude, parse_coordinates
+from core.parsing import create_measurement_validator, create_coordinates_validator
 
 # Load agent settings for Field descriptions
 _agent_settings = get_agent_settings()
 
+# Field descriptions that embed configured defaults - formatted once at import
+_ALTITUDE_DESCRIPTION = f"Target takeoff altitude that drone will climb to with optional units (e.g., '250 feet', '100 meters'). Extract from phrases like 'takeoff to 250 feet', 'launch to 100 meters'. This sets the flight altitude for the mission. DO NOT include unless directly specified by the user. Default = {_agent_settings['takeoff_default_altitude']} {_agent_settings['takeoff_altitude_units']}"
+
 
 class TakeoffInput(BaseModel):
     """Launch drone from ground to specified flight altitude"""
@@ -22,27 +24,11 @@ class TakeoffInput(BaseModel):
     mgrs: Optional[str] = Field(None, description="MGRS coordinate string. Use when user provides MGRS grid coordinates for takeoff location.")
     
     # Target altitude - required parameter
-    altitude: Optional[Union[float, str, tuple]] = Field(None, description=f"Target takeoff altitude that drone will climb to with optional units (e.g., '250 feet', '100 meters'). Extract from phrases like 'takeoff to 250 feet', 'launch to 100 meters'. This sets the flight altitude for the mission. DO NOT include unless directly specified by the user. Default = {_agent_settings['takeoff_default_altitude']} {_agent_settings['takeoff_altitude_units']}")
-    
-    @field_validator('altitude', mode='before')
-    @classmethod
-    def parse_altitude_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_altitude(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    altitude: Optional[Union[float, str, tuple]] = Field(None, description=_ALTITUDE_DESCRIPTION)
     
-    @field_validator('coordinates', mode='before')
-    @classmethod
-    def parse_coordinates_field(cls, v):
-        if v is None:
-            return None
-        lat, lon = parse_coordinates(v)
-        if lat is None or lon is None:
-            return v  # Let Pydantic handle validation error
-        return (lat, lon)
+    # Shared 'before' validators - turn unit/coordinate strings into tuples
+    parse_altitude_field = field_validator('altitude', mode='before')(create_measurement_validator())
+    parse_coordinates_field = field_validator('coordinates', mode='before')(create_coordinates_validator())
     
     # VTOL transition heading
     heading: Optional[str] = Field(None, description="Direction VTOL will point during transition to forward flight: 'north', 'northeast', 'east', 'southeast', 'south', 'southwest', 'west', 'northwest'. Typically into the wind. Use ONLY when direction is specified.")
@@ -52,16 +38,14 @@ class AddTakeoffTool(PX4ToolBase):
     name: str = "add_takeoff"
     description: str = "Add takeoff command to launch drone from ground to flight altitude. Always inserted as the FIRST mission item. Use when user wants drone to take off, launch, or lift off. Use for commands like 'takeoff', 'launch', 'lift off', especially when altitude is specified like 'takeoff to 200 feet', 'launch to 100 meters'."
     args_schema: type = TakeoffInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
     
     def _run(self, coordinates: Optional[Union[str, tuple]] = None, 
              altitude: Optional[Union[float, tuple]] = None, mgrs: Optional[str] = None, heading: Optional[str] = None) -> str:
-        # Create response
-        response = ""
-
-        # Populate response
+        txn = None
         try:
             # Parse measurement tuples from validators
             if isinstance(altitude, tuple):
@@ -75,8 +59,8 @@ class AddTakeoffTool(PX4ToolBase):
             else:
                 latitude, longitude = None, None
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
+            # Record mission changes for potential rollback
+            txn = self.mission_manager.begin_transaction()
             
             # Build coordinate description - for takeoff, usually just use altitude
             coord_desc = ""
@@ -106,21 +90,23 @@ class AddTakeoffTool(PX4ToolBase):
             is_valid, validation_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {validation_msg}" + self._get_mission_state_summary()
             else:
+                txn.commit()
+                
                 # Build response message with preserved units
                 altitude_msg = f"{altitude_value} {altitude_units}" if altitude_value is not None else "default altitude"
                 heading_msg = f", Heading={heading}" if heading is not None else ""
-                response = f"Takeoff command added to mission{coord_desc}, Alt={altitude_msg}{heading_msg} (Item {item.seq + 1})"
                 
                 # Include auto-fix notifications if any
-                if validation_msg:
-                    response += f". {validation_msg}"
-                
-                response += self._get_mission_state_summary()
+                return self._build_response(
+                    f"Takeoff command added to mission{coord_desc}, Alt={altitude_msg}{heading_msg} (Item {item.seq + 1})",
+                    validation_msg
+                )
             
         except Exception as e:
-            response = f"Error: {str(e)}"
-
-        return response
\ No newline at end of file
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
+            return f"Error: {str(e)}"
\ No newline at end of file
@@ -2,17 +2,19 @@
 Add Waypoint Tool - Navigate drone to specific location
 """
 
-from typing import Optional, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
 from config.settings import get_agent_settings
-from core.parsing import parse_altitude, parse_distance, parse_coordinates
+from core.parsing import create_measurement_validator, create_coordinates_validator
 
 # Load agent settings for Field descriptions
 _agent_settings = get_agent_settings()
 
+# Field descriptions that embed configured defaults - formatted once at import
+_ALTITUDE_DESCRIPTION = f"Flight altitude for this waypoint with optional units (e.g., '150 feet', '50 meters'). Specify only if user mentions altitude. Default = {_agent_settings['waypoint_default_altitude']} {_agent_settings['waypoint_altitude_units']}"
+
 
 class WaypointInput(BaseModel):
     """Navigate drone to specific location using GPS coordinates OR relative positioning"""
@@ -27,38 +29,13 @@ class WaypointInput(BaseModel):
     relative_reference_frame: Optional[str] = Field(None, description="Reference point for distance: 'origin' (takeoff), 'last_waypoint'. You MUST pick one, make an educated guess if using relative positioning. Use 'origin' when user references 'start', 'takeoff', 'here', etc. Otherwise assume last_waypoint.")
     
     # Altitude specification
-    altitude: Optional[Union[float, str, tuple]] = Field(None, description=f"Flight altitude for this waypoint with optional units (e.g., '150 feet', '50 meters'). Specify only if user mentions altitude. Default = {_agent_settings['waypoint_default_altitude']} {_agent_settings['waypoint_altitude_units']}")
-    
-    @field_validator('distance', mode='before')
-    @classmethod
-    def parse_distance_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_distance(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    altitude: Optional[Union[float, str, tuple]] = Field(None, description=_ALTITUDE_DESCRIPTION)
     
-    @field_validator('altitude', mode='before')
-    @classmethod
-    def parse_altitude_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_altitude(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    # Shared 'before' validators - turn unit/coordinate strings into tuples
+    parse_distance_field = field_validator('distance', mode='before')(create_measurement_validator())
+    parse_altitude_field = field_validator('altitude', mode='before')(create_measurement_validator())
+    parse_coordinates_field = field_validator('coordinates', mode='before')(create_coordinates_validator())
     
-    @field_validator('coordinates', mode='before')
-    @classmethod
-    def parse_coordinates_field(cls, v):
-        if v is None:
-            return None
-        lat, lon = parse_coordinates(v)
-        if lat is None or lon is None:
-            return v  # Let Pydantic handle validation error
-        return (lat, lon)
-        
     # Insertion position
     seq: Optional[int] = Field(None, description="Position to insert waypoint in mission (1-based index). The waypoint will be inserted AT this position, shifting existing items down. Omit to add at end.")
     
@@ -71,6 +48,7 @@ class AddWaypointTool(PX4ToolBase):
     name: str = "add_waypoint"
     description: str = "Add waypoint for drone navigation to specific location. Use when user wants drone to fly to a location using exact GPS coordinates or relative directions. Creates flight path point where drone flies to location, flies THROUGH it, then continues to the next mission item. The drone can perform AI searches with its camera while passing through a waypoint. Specify Lat/Long OR MGRS OR distance/heading/reference. Do not mix location systems."
     args_schema: type = WaypointInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
@@ -79,10 +57,7 @@ class AddWaypointTool(PX4ToolBase):
              distance: Optional[Union[float, tuple]] = None, heading: Optional[str] = None,
              relative_reference_frame: Optional[str] = None, altitude: Optional[Union[float, tuple]] = None,
              seq: Optional[int] = None, search_target: Optional[str] = None, detection_behavior: Optional[str] = None) -> str:
-        # Create response
-        response = ""
-
-        # Populate response
+        txn = None
         try:
             # Parse measurement tuples from validators
             if isinstance(distance, tuple):
@@ -101,8 +76,8 @@ class AddWaypointTool(PX4ToolBase):
             else:
                 latitude, longitude = None, None
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
+            # Record mission changes for potential rollback
+            txn = self.mission_manager.begin_transaction()
             
             # Build coordinate description following wx-agent pattern
             coord_desc = self._build_coordinate_description(latitude, longitude, mgrs, distance_value, heading, distance_units, relative_reference_frame)
@@ -133,20 +108,22 @@ class AddWaypointTool(PX4ToolBase):
             is_valid, validation_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {validation_msg}" + self._get_mission_state_summary()
             else:
+                txn.commit()
+                
                 # Build response message with preserved units
                 altitude_msg = f"{altitude_value} {altitude_units}" if altitude_value is not None else "not specified"
-                response = f"Waypoint added to mission: {coord_desc}, Alt={altitude_msg} (Item {item.seq + 1})"
                 
                 # Include auto-fix notifications if any
-                if validation_msg:
-                    response += f". {validation_msg}"
-                
-                response += self._get_mission_state_summary()
+                return self._build_response(
+                    f"Waypoint added to mission: {coord_desc}, Alt={altitude_msg} (Item {item.seq + 1})",
+                    validation_msg
+                )
             
         except Exception as e:
-            response = f"Error: {str(e)}"
-
-        return response
\ No newline at end of file
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
+            return f"Error: {str(e)}"
\ No newline at end of file
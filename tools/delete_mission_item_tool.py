@@ -2,7 +2,7 @@
 Delete Mission Item Tool - Remove specific mission item by sequence number
 """
 
-from langchain_core.tools import BaseTool
+from typing import ClassVar
 from pydantic import BaseModel, Field
 
 from .tools import PX4ToolBase
@@ -18,50 +18,48 @@ class DeleteMissionItemTool(PX4ToolBase):
     name: str = "delete_mission_item"
     description: str = "Delete specific mission item by its sequence number. Use when user wants to remove a particular item from the mission by specifying its position or when you need to correct a mistake you made. Use for commands like 'delete the second waypoint', 'remove item 1', 'get rid of that survey'. Item is permanently removed and remaining items are renumbered."
     args_schema: type = DeleteMissionItemInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
     
     def _run(self, seq: int) -> str:
-        # Create response
-        response = ""
-
-        # Populate response
+        txn = None
         try:
             mission = self.mission_manager.get_mission()
             if not mission or not mission.items:
-                response = "Error: No mission items to delete"
+                return "Error: No mission items to delete"
             else:
-                # Save current mission state for potential rollback
-                saved_state = self._save_mission_state()
+                items = mission.items
+                item_count = len(items)
                 
                 # Convert 1-based indexing to 0-based
                 zero_based_seq = seq - 1
-                if seq < 1 or zero_based_seq >= len(mission.items):
-                    response = f"Error: Invalid sequence number {seq}. Mission has {len(mission.items)} items (1 to {len(mission.items)})"
+                if not 0 <= zero_based_seq < item_count:
+                    return f"Error: Invalid sequence number {seq}. Mission has {item_count} items (1 to {item_count})"
                 else:
                     # Get item info before deletion for confirmation message
-                    item_to_delete = mission.items[zero_based_seq]
-                    command_name = self._get_command_name(getattr(item_to_delete, 'command_type', 'unknown'))
+                    item_to_delete = items[zero_based_seq]
+                    command_name = self._get_command_name(item_to_delete.command_type)
                     
-                    # Remove the item from the mission
-                    del mission.items[zero_based_seq]
+                    # Record mission changes for potential rollback
+                    txn = self.mission_manager.begin_transaction()
                     
-                    # Resequence remaining items
-                    for i, item in enumerate(mission.items):
-                        item.seq = i
+                    # Remove the item from the mission (resequences remaining items)
+                    mission.remove_item(zero_based_seq)
                     
                     # Validate mission after deletion
                     is_valid, error_msg = self._validate_mission_after_action()
                     if not is_valid:
                         # Rollback the action
-                        self._restore_mission_state(saved_state)
+                        txn.rollback()
                         return f"Planning Error: {error_msg}" + self._get_mission_state_summary()
                     else:
-                        response = f"Deleted mission item {seq} ({command_name}). Mission now has {len(mission.items)} items."
-                        response += self._get_mission_state_summary()
+                        txn.commit()
+                        return self._build_response(f"Deleted mission item {seq} ({command_name}). Mission now has {len(items)} items.")
             
         except Exception as e:
-            response = f"Error: {str(e)}"
-
-        return response
\ No newline at end of file
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
+            return f"Error: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Fast Tool Argument Validation
+Compiled fast path for flat tool input schemas, falling back to Pydantic when unsure
+"""
+
+import sys
+import types
+import inspect
+from typing import Any, Dict, Optional, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+# Runtime types the fast path can check with an exact type() comparison
+_SIMPLE_TYPES = frozenset({str, int, float, tuple, type(None)})
+
+# Defaults that are safe to hand out without Pydantic's copy semantics
+_IMMUTABLE_DEFAULT_TYPES = (type(None), str, int, float, bool, tuple)
+
+# typing.Union plus PEP 604 `X | None` unions (Python 3.10+)
+_UNION_ORIGINS = (Union, getattr(types, 'UnionType', Union))
+
+_UNCOMPILED = object()
+
+
+def get_fast_schema(model: type) -> Optional[Tuple[tuple, ...]]:
+    """Get the compiled field specs for a model, compiling once and caching on the class"""
+    schema = model.__dict__.get('__fast_schema__', _UNCOMPILED)
+    if schema is _UNCOMPILED:
+        schema = compile_fast_schema(model)
+        setattr(model, '__fast_schema__', schema)
+    return schema
+
+
+def compile_fast_schema(model: type) -> Optional[Tuple[tuple, ...]]:
+    """
+    Compile a Pydantic model into flat field specs for fast_validate.
+
+    Each spec is (name, allowed_types, int_to_float, before_validator, default, required).
+    Field names are interned so input dict lookups hit the string identity fast path.
+
+    Returns:
+        Tuple of field specs, or None if the model uses anything the fast path
+        cannot reproduce exactly (constraints, aliases, after/wrap validators, ...)
+    """
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return None
+
+    config = model.model_config
+    if config.get('strict') or config.get('extra') not in (None, 'ignore') or config.get('str_strip_whitespace'):
+        return None
+
+    decorators = model.__pydantic_decorators__
+    if decorators.model_validators or decorators.root_validators or decorators.validators:
+        return None
+
+    # Only single-argument 'before' field validators (no ValidationInfo) are supported
+    before_validators: Dict[str, Any] = {}
+    for decorator in decorators.field_validators.values():
+        if decorator.info.mode != 'before':
+            return None
+        validator = getattr(model, decorator.cls_var_name)
+        if len(inspect.signature(validator).parameters) != 1:
+            return None
+        for field_name in decorator.info.fields:
+            if field_name in before_validators:
+                return None
+            before_validators[field_name] = validator
+
+    specs = []
+    for name, field_info in model.model_fields.items():
+        if field_info.alias or field_info.metadata or field_info.default_factory is not None:
+            return None
+
+        allowed_types = _get_allowed_types(field_info.annotation)
+        if allowed_types is None:
+            return None
+
+        required = field_info.is_required()
+        default = None if required else field_info.default
+        if not isinstance(default, _IMMUTABLE_DEFAULT_TYPES):
+            return None
+
+        int_to_float = float in allowed_types and int not in allowed_types
+        specs.append((sys.intern(name), allowed_types, int_to_float, before_validators.get(name), default, required))
+
+    return tuple(specs)
+
+
+def fast_validate(model: type, tool_input: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Validate tool input against a compiled model schema.
+
+    Mirrors what BaseTool._parse_input hands to _run: provided fields (validated)
+    plus defaults for omitted optional fields, in model field order.
+
+    Returns:
+        Validated argument dict, or None when the input needs full Pydantic
+        validation (coercion beyond int->float, missing required fields, errors)
+    """
+    specs = get_fast_schema(model)
+    if specs is None:
+        return None
+
+    validated = {}
+    for name, allowed_types, int_to_float, before, default, required in specs:
+        if name in tool_input:
+            value = tool_input[name]
+            if before is not None:
+                try:
+                    value = before(value)
+                except Exception:
+                    return None
+            if type(value) not in allowed_types:
+                if int_to_float and type(value) is int:
+                    value = float(value)
+                else:
+                    return None
+            validated[name] = value
+        elif required:
+            return None
+        else:
+            validated[name] = default
+
+    return validated
+
+
+def model_validate_to_dict(model: type, tool_input: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Fully validate tool input with Pydantic and build the _run kwargs straight
+    from the validated instance's fields.
+    
+    Same result as BaseTool._parse_input for compiled (flat, alias-free) models,
+    without its model_dump() pass and per-call annotation scan.
+    
+    Returns:
+        Validated argument dict, or None if the model has no compiled schema
+    
+    Raises:
+        pydantic.ValidationError: If the input is invalid
+    """
+    specs = get_fast_schema(model)
+    if specs is None:
+        return None
+    
+    values = model.model_validate(tool_input).__dict__
+    return {
+        name: values[name]
+        for name, _, _, _, _, required in specs
+        if not required or name in tool_input
+    }
+
+
+def _get_allowed_types(annotation: Any) -> Optional[frozenset]:
+    """Flatten Optional/Union annotations of simple types into a set of exact runtime types"""
+    if get_origin(annotation) in _UNION_ORIGINS:
+        members = get_args(annotation)
+    else:
+        members = (annotation,)
+
+    allowed = frozenset(members)
+    if not allowed <= _SIMPLE_TYPES:
+        return None
+    return allowed
@@ -2,12 +2,11 @@
 Move Item Tool - Change geographical position of mission item
 """
 
-from typing import Optional, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
-from core.parsing import parse_distance, parse_coordinates
+from core.parsing import create_measurement_validator, create_coordinates_validator
 
 
 class MoveItemInput(BaseModel):
@@ -24,31 +23,16 @@ class MoveItemInput(BaseModel):
     heading: Optional[str] = Field(None, description="New compass direction as text.")
     relative_reference_frame: Optional[str] = Field(None, description="New reference point for distance measurement. Use 'origin' when user references 'start', 'takeoff', 'here', etc., 'last_waypoint' if the user references the last waypoint, or 'self' to move the item relative to its current position. Use 'self' for commands like 'move the waypoint 2 mi west' 'update the orbit point to be 1500m south of current position'. Any time you want to move an item relative to its current position, you should use 'self'")
     
-    @field_validator('distance', mode='before')
-    @classmethod
-    def parse_distance_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_distance(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
-    
-    @field_validator('coordinates', mode='before')
-    @classmethod
-    def parse_coordinates_field(cls, v):
-        if v is None:
-            return None
-        lat, lon = parse_coordinates(v)
-        if lat is None or lon is None:
-            return v  # Let Pydantic handle validation error
-        return (lat, lon)
+    # Shared 'before' validators - turn unit/coordinate strings into tuples
+    parse_distance_field = field_validator('distance', mode='before')(create_measurement_validator())
+    parse_coordinates_field = field_validator('coordinates', mode='before')(create_coordinates_validator())
 
 
 class MoveItemTool(PX4ToolBase):
     name: str = "move_item"
     description: str = "Move mission item to new geographical position using GPS coordinates, MGRS, or relative positioning. For changing altitude, radius, or search parameters, use update_mission_item tool instead."
     args_schema: type = MoveItemInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
@@ -57,6 +41,7 @@ class MoveItemTool(PX4ToolBase):
              distance: Optional[Union[float, tuple]] = None, heading: Optional[str] = None, 
              relative_reference_frame: Optional[str] = None) -> str:
         
+        txn = None
         try:
             # Parse measurement tuples from validators
             if isinstance(distance, tuple):
@@ -74,9 +59,6 @@ class MoveItemTool(PX4ToolBase):
             if not mission or not mission.items:
                 return "Error: No mission items to move"
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
-            
             # Convert 1-based indexing to 0-based
             zero_based_seq = seq - 1
             if seq < 1 or zero_based_seq >= len(mission.items):
@@ -85,8 +67,12 @@ class MoveItemTool(PX4ToolBase):
             item = mission.items[zero_based_seq]
             changes_made = []
             
+            # Record the item's current fields for potential rollback
+            txn = self.mission_manager.begin_transaction()
+            mission.record_item_state(item)
+            
             # Check if this item supports position updates (waypoint, loiter, survey) or heading (takeoff)
-            command_type = getattr(item, 'command_type', None)
+            command_type = item.command_type
             supports_position = command_type in ['waypoint', 'loiter', 'survey']
             supports_heading = command_type in ['takeoff', 'waypoint', 'loiter', 'survey']
             
@@ -96,12 +82,13 @@ class MoveItemTool(PX4ToolBase):
                     item.latitude = latitude
                     item.longitude = longitude
                     # Clear relative positioning when setting GPS coordinates
-                    if hasattr(item, 'distance'): item.distance = None
-                    if hasattr(item, 'heading'): item.heading = None
-                    if hasattr(item, 'mgrs'): item.mgrs = None
-                    if hasattr(item, 'relative_reference_frame'): item.relative_reference_frame = None
+                    item.distance = None
+                    item.heading = None
+                    item.mgrs = None
+                    item.relative_reference_frame = None
                     changes_made.append(f"position to lat/long ({latitude:.6f}, {longitude:.6f})")
                 else:
+                    txn.rollback()
                     return f"Error: Cannot modify GPS coordinates on item {seq} - {command_type} commands don't support positioning"
             
             # Update MGRS coordinate if provided
@@ -109,13 +96,14 @@ class MoveItemTool(PX4ToolBase):
                 if supports_position:
                     item.mgrs = mgrs
                     # Clear other positioning when setting MGRS
-                    if hasattr(item, 'latitude'): item.latitude = None
-                    if hasattr(item, 'longitude'): item.longitude = None
-                    if hasattr(item, 'distance'): item.distance = None
-                    if hasattr(item, 'heading'): item.heading = None
-                    if hasattr(item, 'relative_reference_frame'): item.relative_reference_frame = None
+                    item.latitude = None
+                    item.longitude = None
+                    item.distance = None
+                    item.heading = None
+                    item.relative_reference_frame = None
                     changes_made.append(f"position to MGRS {mgrs}")
                 else:
+                    txn.rollback()
                     return f"Error: Cannot modify MGRS coordinates on item {seq} - {command_type} commands don't support positioning"
             
             # Update relative positioning if provided
@@ -159,19 +147,21 @@ class MoveItemTool(PX4ToolBase):
                         item.longitude = new_lon
                         
                         # Clear all positioning attributes except lat/lon
-                        if hasattr(item, 'mgrs'): item.mgrs = None
-                        if hasattr(item, 'distance'): item.distance = None
-                        if hasattr(item, 'heading'): item.heading = None
-                        if hasattr(item, 'distance_units'): item.distance_units = None
-                        if hasattr(item, 'relative_reference_frame'): item.relative_reference_frame = None
+                        item.mgrs = None
+                        item.distance = None
+                        item.heading = None
+                        item.distance_units = None
+                        item.relative_reference_frame = None
                         
                         units_text = f" {distance_units}" if distance_units else ""
                         ref_desc = "current location" if relative_reference_frame == 'self' else (relative_reference_frame or "origin")
                         changes_made.append(f"position to {distance_value}{units_text} {heading} from {ref_desc} (new coordinates: {new_lat:.6f}, {new_lon:.6f})")
                         
                     except Exception as e:
+                        txn.rollback()
                         return f"Error: Failed to calculate new position - {str(e)}"
                 else:
+                    txn.rollback()
                     return f"Error: Cannot modify position on item {seq} - {command_type} commands don't support positioning"
             
             # Update heading only (for takeoff VTOL transition direction)
@@ -180,33 +170,38 @@ class MoveItemTool(PX4ToolBase):
                     item.heading = heading
                     changes_made.append(f"heading to {heading}")
                 else:
+                    txn.rollback()
                     return f"Error: Cannot modify heading on item {seq} - {command_type} commands don't support heading"
             
             # Check if we have a successful update
             if not changes_made:
+                txn.rollback()
                 return "No position changes specified - provide GPS coordinates (lat/long), MGRS, or relative positioning (distance/heading) to move the item"
             
             # Validate mission after modifications
             is_valid, error_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {error_msg}" + self._get_mission_state_summary()
             
+            txn.commit()
+            
             changes_str = ", ".join(changes_made)
-            response = f"Moved mission item {seq}: {changes_str}"
-            response += self._get_mission_state_summary()
-            return response
+            return self._build_response(f"Moved mission item {seq}: {changes_str}")
             
         except Exception as e:
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
             return f"Error: {str(e)}"
     
     def _find_last_waypoint_coordinates(self, mission, current_index):
         """Find coordinates from last waypoint or navigation command"""
         for i in range(current_index - 1, -1, -1):
             prev_item = mission.items[i]
-            if (getattr(prev_item, 'command_type', None) in ['waypoint', 'takeoff', 'loiter', 'survey'] and
-                hasattr(prev_item, 'latitude') and prev_item.latitude is not None and
-                hasattr(prev_item, 'longitude') and prev_item.longitude is not None):
+            if (prev_item.command_type in ['waypoint', 'takeoff', 'loiter', 'survey'] and
+                prev_item.latitude is not None and
+                prev_item.longitude is not None):
                 return (prev_item.latitude, prev_item.longitude)
         return None
\ No newline at end of file
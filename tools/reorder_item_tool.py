@@ -2,7 +2,7 @@
 Reorder Item Tool - Reposition mission item to different sequence position
 """
 
-from langchain_core.tools import BaseTool
+from typing import ClassVar
 from pydantic import BaseModel, Field
 
 from .tools import PX4ToolBase
@@ -19,19 +19,18 @@ class ReorderItemTool(PX4ToolBase):
     name: str = "reorder_item"
     description: str = "Reorder mission items by moving one item to a different sequence position. Use when user wants to change the order of mission execution or when an item ends up in an unexpected sequence position. All other items automatically shift to accommodate the reorder."
     args_schema: type = ReorderItemInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
     
     def _run(self, seq: int, insert_at: int) -> str:
+        txn = None
         try:
             mission = self.mission_manager.get_mission()
             if not mission or not mission.items:
                 return "Error: No mission items to move"
             
-            # Save current mission state for potential rollback
-            saved_state = self._save_mission_state()
-            
             # Convert 1-based indexing to 0-based
             zero_based_seq = seq - 1
             zero_based_insert_at = insert_at - 1
@@ -50,10 +49,13 @@ class ReorderItemTool(PX4ToolBase):
             
             # Get item info for confirmation message
             item_to_move = mission.items[zero_based_seq]
-            command_name = self._get_command_name(getattr(item_to_move, 'command_type', 'unknown'))
+            command_name = self._get_command_name(item_to_move.command_type)
+            
+            # Record mission changes for potential rollback
+            txn = self.mission_manager.begin_transaction()
             
             # Remove item from current position
-            moved_item = mission.items.pop(zero_based_seq)
+            moved_item = mission.remove_item(zero_based_seq)
             
             # Adjust insertion index if moving item forward (since we removed an item)
             if insert_at > seq:
@@ -61,24 +63,23 @@ class ReorderItemTool(PX4ToolBase):
             else:
                 adjusted_insert_at = zero_based_insert_at
             
-            # Insert at new position
-            mission.items.insert(adjusted_insert_at, moved_item)
-            
-            # Resequence all items
-            for i, item in enumerate(mission.items):
-                item.seq = i
+            # Insert at new position (resequences following items)
+            mission.insert_item(adjusted_insert_at, moved_item)
             
             # Validate mission after move
             is_valid, error_msg = self._validate_mission_after_action()
             if not is_valid:
                 # Rollback the action
-                self._restore_mission_state(saved_state)
+                txn.rollback()
                 return f"Planning Error: {error_msg}" + self._get_mission_state_summary()
             
+            txn.commit()
+            
             # Build success response
-            response = f"Reordered mission item {seq} ({command_name}) to position {insert_at}. Mission sequence updated successfully."
-            response += self._get_mission_state_summary()
-            return response
+            return self._build_response(f"Reordered mission item {seq} ({command_name}) to position {insert_at}. Mission sequence updated successfully.")
             
         except Exception as e:
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
             return f"Error: {str(e)}"
\ No newline at end of file
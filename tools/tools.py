@@ -3,12 +3,14 @@ PX4 Mission Planning Tools - Main module
 Contains shared functions, schemas, and tool registry
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import Dict, Any, Optional, List, ClassVar, Union
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from core.manager import MissionManager
 from config.settings import get_agent_settings
+from .fast_validator import fast_validate, model_validate_to_dict
 
 
 # Model Parameter Schemas - Maps command types to ALL parameters the model can return
@@ -46,10 +48,46 @@ MODEL_PARAMETER_SCHEMAS = {
     }
 }
 
+# Human-readable command names by command type
+COMMAND_NAMES = {
+    'takeoff': "Takeoff",
+    'waypoint': "Waypoint",
+    'loiter': "Loiter",
+    'rtl': "Return to Launch",
+    'survey': "Survey"
+}
+
+# Display emoji by command type
+COMMAND_EMOJIS = {
+    'takeoff': "🚀",
+    'waypoint': "📍", 
+    'loiter': "🔄",
+    'rtl': "🏠",
+    'survey': "🗺️"
+}
+
+# Shown for parameters the model left empty
+UNSPECIFIED_MARKER = "unspecified"
+
+# MODEL_PARAMETER_SCHEMAS flattened for display - (category header, ((param, line prefix), ...)) per category
+_PARAMETER_DISPLAY_LAYOUTS = {
+    command_type: tuple(
+        (f"\n[{category}]\n", tuple((param, f"    {param}: ") for param in params))
+        for category, params in schema.items()
+    )
+    for command_type, schema in MODEL_PARAMETER_SCHEMAS.items()
+}
+
+# Tool call schemas shared across instances - tools are rebuilt on every mode switch
+_TOOL_CALL_SCHEMA_CACHE: Dict[tuple, Any] = {}
+
 # Base class for all mission item tools
 class PX4ToolBase(BaseTool):
     """Base class providing shared functionality for all PX4 tools"""
     
+    # Validate arguments with the compiled fast path before falling back to Pydantic
+    strict_fast: ClassVar[bool] = False
+    
     def __init__(self, mission_manager: MissionManager):
         super().__init__()
         self._mission_manager = mission_manager
@@ -60,16 +98,44 @@ class PX4ToolBase(BaseTool):
     def mission_manager(self):
         return self._mission_manager
     
+    def _parse_input(self, tool_input: Union[str, Dict[str, Any]], tool_call_id: Optional[str]) -> Union[str, Dict[str, Any]]:
+        """Validate tool arguments, skipping full Pydantic validation when the fast path can"""
+        if self.strict_fast and isinstance(tool_input, dict):
+            validated = fast_validate(self.args_schema, tool_input)
+            if validated is None:
+                # Needs real coercion or reports errors - let Pydantic validate
+                validated = model_validate_to_dict(self.args_schema, tool_input)
+            if validated is not None:
+                return validated
+        return super()._parse_input(tool_input, tool_call_id)
+    
+    @property
+    def tool_call_schema(self):
+        """Schema the LLM sees for this tool, built once per tool class instead of per instance"""
+        key = (type(self), self.name, self.description, self.args_schema)
+        schema = _TOOL_CALL_SCHEMA_CACHE.get(key)
+        if schema is None:
+            schema = _TOOL_CALL_SCHEMA_CACHE[key] = super().tool_call_schema
+        return schema
+    
+    def run(self, *args, **kwargs):
+        """Run the tool, holding the mission lock so concurrent tool calls can't interleave edits"""
+        with self.mission_manager.lock:
+            return super().run(*args, **kwargs)
+    
+    async def _arun(self, *args, **kwargs) -> str:
+        """Run the tool in a worker thread so the event loop stays free while the mission is edited"""
+        return await asyncio.to_thread(self._run_locked, *args, **kwargs)
+    
+    def _run_locked(self, *args, **kwargs) -> str:
+        """Call _run while holding the mission lock"""
+        with self.mission_manager.lock:
+            return self._run(*args, **kwargs)
+    
     def _get_command_name(self, command_type: str) -> str:
         """Get human-readable command name from type"""
-        command_map = {
-            'takeoff': "Takeoff",
-            'waypoint': "Waypoint",
-            'loiter': "Loiter",
-            'rtl': "Return to Launch",
-            'survey': "Survey"
-        }
-        return command_map.get(command_type, f"Unknown {command_type}")
+        name = COMMAND_NAMES.get(command_type)
+        return name if name is not None else f"Unknown {command_type}"
     
     def _validate_mission_after_action(self) -> tuple[bool, str]:
         """Validate mission after action is performed - allows rollback if invalid"""
@@ -77,6 +143,9 @@ class PX4ToolBase(BaseTool):
         if not mission:
             return True, ""
         
+        # Tools edit items in place, so record the mutation before validating
+        self.mission_manager.mark_modified()
+        
         # Use the comprehensive mission validation from MissionManager with mode-specific rules
         is_valid, message_list = self.mission_manager.validate_mission()
         
@@ -92,55 +161,36 @@ class PX4ToolBase(BaseTool):
         
         return True, ""
     
-    def _save_mission_state(self):
-        """Save current mission state for rollback"""
-        mission = self.mission_manager.get_mission()
-        if mission:
-            # Save a copy of all mission items
-            return [item for item in mission.items]
-        return []
-    
-    def _restore_mission_state(self, saved_state):
-        """Restore mission state from saved state"""
-        mission = self.mission_manager.get_mission()
-        if mission:
-            mission.items.clear()
-            mission.items.extend(saved_state)
-    
     def _get_detailed_parameter_display(self, item) -> str:
         """Show ALL model-available parameters for this mission item"""
-        COMMAND_EMOJIS = {
-            'takeoff': "🚀",
-            'waypoint': "📍", 
-            'loiter': "🔄",
-            'rtl': "🏠",
-            'survey': "🗺️"
-        }
-        UNSPECIFIED_MARKER = "unspecified"
-        
-        command_type = getattr(item, 'command_type', 'unknown')
+        command_type = item.command_type
         command_name = self._get_command_name(command_type)
-        schema = MODEL_PARAMETER_SCHEMAS.get(command_type, {})
+        values = item.__dict__
         
-        emoji = COMMAND_EMOJIS.get(command_type, '❓')
-        display = f"{emoji} {command_name.upper()} (Item {item.seq + 1})\n"
+        parts = [f"{COMMAND_EMOJIS.get(command_type, '❓')} {command_name.upper()} (Item {item.seq + 1})\n"]
         
         # Show all available parameters from schema
-        for category, params in schema.items():
-            display += f"\n[{category}]\n"
-            for param in params:
-                value = getattr(item, param, None)
-                if value is None:
-                    display += f"    {param}: {UNSPECIFIED_MARKER}\n"
-                else:
-                    display += f"    {param}: {value}\n"
+        for header, fields in _PARAMETER_DISPLAY_LAYOUTS.get(command_type, ()):
+            parts.append(header)
+            for param, prefix in fields:
+                value = values.get(param)
+                parts.append(f"{prefix}{UNSPECIFIED_MARKER if value is None else value}\n")
         
-        return display
+        return "".join(parts)
     
     def _get_mission_state_summary(self) -> str:
         """Get brief summary of current mission state - now delegates to mission manager"""
         return self.mission_manager.get_mission_state_summary()
     
+    def _build_response(self, message: str, validation_msg: str = "") -> str:
+        """Join the result message, any auto-fix notifications and the mission state summary"""
+        parts = [message]
+        if validation_msg:
+            parts.append(". ")
+            parts.append(validation_msg)
+        parts.append(self._get_mission_state_summary())
+        return "".join(parts)
+    
     def _build_coordinate_description(self, latitude, longitude, mgrs, distance, heading, distance_units, relative_reference_frame):
         """Build coordinate description for responses"""
         if latitude is not None and longitude is not None:
@@ -2,12 +2,11 @@
 Update Mission Item Tool - Modify specific mission item by sequence number
 """
 
-from typing import Optional, Union
-from langchain_core.tools import BaseTool
+from typing import ClassVar, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from .tools import PX4ToolBase
-from core.parsing import parse_altitude, parse_radius
+from core.parsing import create_measurement_validator
 
 
 class UpdateMissionItemInput(BaseModel):
@@ -23,25 +22,9 @@ class UpdateMissionItemInput(BaseModel):
     radius: Optional[Union[float, str, tuple]] = Field(None, description="New radius for orbit/loiter items only with optional units (e.g., '500 feet', '100 meters'). Only works on loiter commands.")
     
     
-    @field_validator('altitude', mode='before')
-    @classmethod
-    def parse_altitude_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_altitude(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
-    
-    @field_validator('radius', mode='before')
-    @classmethod
-    def parse_radius_field(cls, v):
-        if v is None:
-            return None
-        parsed_value, units = parse_radius(v)
-        if parsed_value is None:
-            return v  # Let Pydantic handle validation error
-        return (parsed_value, units)
+    # Shared 'before' validators - turn unit strings into (value, units) tuples
+    parse_altitude_field = field_validator('altitude', mode='before')(create_measurement_validator())
+    parse_radius_field = field_validator('radius', mode='before')(create_measurement_validator())
     
     
     # Search parameters
@@ -53,6 +36,7 @@ class UpdateMissionItemTool(PX4ToolBase):
     name: str = "update_mission_item"
     description: str = "Update mission item altitude, radius, and search parameters by sequence number. Use when user wants to modify item properties like height, orbit size, or search behavior. For position changes, use move_item tool. You CANNOT update a mission item TYPE - delete and recreate instead."
     args_schema: type = UpdateMissionItemInput
+    strict_fast: ClassVar[bool] = True
     
     def __init__(self, mission_manager):
         super().__init__(mission_manager)
@@ -62,6 +46,7 @@ class UpdateMissionItemTool(PX4ToolBase):
              search_target: Optional[str] = None, detection_behavior: Optional[str] = None) -> str:
         # Create response
         response = ""
+        txn = None
 
         # Populate response
         try:
@@ -80,9 +65,6 @@ class UpdateMissionItemTool(PX4ToolBase):
             if not mission or not mission.items:
                 response = "Error: No mission items to update"
             else:
-                # Save current mission state for potential rollback
-                saved_state = self._save_mission_state()
-                
                 # Convert 1-based indexing to 0-based
                 zero_based_seq = seq - 1
                 if seq < 1 or zero_based_seq >= len(mission.items):
@@ -90,22 +72,25 @@ class UpdateMissionItemTool(PX4ToolBase):
                 else:
                     item = mission.items[zero_based_seq]
                     changes_made = []
-                    command_type = getattr(item, 'command_type', None)
+                    
+                    # Record the item's current fields for potential rollback
+                    txn = self.mission_manager.begin_transaction()
+                    mission.record_item_state(item)
+                    
+                    command_type = item.command_type
                     
                     # Update altitude if provided
                     if altitude_value is not None:
-                        if hasattr(item, 'altitude'):
-                            item.altitude = altitude_value
-                        if altitude_units and hasattr(item, 'altitude_units'):
+                        item.altitude = altitude_value
+                        if altitude_units:
                             item.altitude_units = altitude_units
                         changes_made.append(f"altitude to {altitude_value} {altitude_units or 'meters'}")
                     
                     # Update radius if provided (for loiter and survey items)
                     if radius_value is not None:
                         if command_type in ['loiter', 'survey']:
-                            if hasattr(item, 'radius'):
-                                item.radius = radius_value
-                            if radius_units and hasattr(item, 'radius_units'):
+                            item.radius = radius_value
+                            if radius_units:
                                 item.radius_units = radius_units
                             changes_made.append(f"radius to {radius_value} {radius_units or 'meters'}")
                         else:
@@ -113,32 +98,37 @@ class UpdateMissionItemTool(PX4ToolBase):
                     
                     # Update search parameters if provided
                     if search_target is not None:
-                        if hasattr(item, 'search_target'):
-                            item.search_target = search_target
+                        item.search_target = search_target
                         changes_made.append(f"search_target to {search_target}")
                     
                     if detection_behavior is not None:
-                        if hasattr(item, 'detection_behavior'):
-                            item.detection_behavior = detection_behavior
+                        item.detection_behavior = detection_behavior
                         changes_made.append(f"detection_behavior to {detection_behavior}")
                     
                     # Check if we have a successful update
-                    if not response.startswith("Error:"):
+                    if response.startswith("Error:"):
+                        # Drop any edits applied before the error
+                        txn.rollback()
+                    else:
                         if not changes_made:
+                            txn.rollback()
                             response = "No changes specified - provide altitude, radius, search_target, or detection_behavior parameters to modify. For position changes, use move_item tool."
                         else:
                             # Validate mission after modifications
                             is_valid, error_msg = self._validate_mission_after_action()
                             if not is_valid:
                                 # Rollback the action
-                                self._restore_mission_state(saved_state)
+                                txn.rollback()
                                 return f"Planning Error: {error_msg}" + self._get_mission_state_summary()
                             else:
+                                txn.commit()
                                 changes_str = ", ".join(changes_made)
-                                response = f"Updated mission item {seq}: {changes_str}"
-                                response += self._get_mission_state_summary()
+                                response = self._build_response(f"Updated mission item {seq}: {changes_str}")
             
         except Exception as e:
+            # Undo any partial edit before reporting the failure
+            if txn is not None:
+                txn.rollback()
             response = f"Error: {str(e)}"
 
         return response
\ No newline at end of file